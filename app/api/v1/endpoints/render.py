@@ -42,7 +42,7 @@ class RenderRequest(BaseModel):
     prompt: str
     creative: Optional[bool] = False
     duration: Optional[int] = 5
-    resolution: Optional[str] = "1080p"
+    resolution: Optional[str] = "720p"
     style: Optional[str] = "minimal"
     animation: Optional[str] = "fade"
 
@@ -222,7 +222,7 @@ async def get_ai_status():
         try:
             # Quick test with a simple prompt
             test_result = await asyncio.wait_for(
-                llm_client.generate_dsl("test", temperature=0.1, max_tokens=50),
+                llm_client.generate_dsl("test", temperature=0.1, max_tokens=50, use_cache=False),
                 timeout=5.0
             )
             ai_status["local_llm"]["status"] = "available" if test_result else "error"
@@ -235,7 +235,7 @@ async def get_ai_status():
         try:
             # Quick test
             test_result = await asyncio.wait_for(
-                llm_client.generate_dsl("test", temperature=0.1, max_tokens=50),
+                llm_client.generate_dsl("test", temperature=0.1, max_tokens=50, use_cache=False),
                 timeout=5.0
             )
             ai_status["openai"]["status"] = "available" if test_result else "error"
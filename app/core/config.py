@@ -25,7 +25,12 @@ class Settings(BaseSettings):
     # Redis settings
     REDIS_URL: str = Field(default="redis://localhost:6379", env="REDIS_URL")
     REDIS_DSN: str = Field(default="redis://localhost:6379", env="REDIS_DSN")
+    LLM_CACHE_TTL: int = Field(default=86400, env="LLM_CACHE_TTL")  # 24 hours
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=1024, env="LLM_CACHE_MAX_ENTRIES")
     REMOTION_TIMEOUT: int = Field(default=300, env="REMOTION_TIMEOUT")  # 5 minutes
+    MAX_CONCURRENT_RENDERS: int = Field(default=2, env="MAX_CONCURRENT_RENDERS")  # Dedicated render pool size
+    WORKER_CONCURRENCY: int = Field(default=2, env="WORKER_CONCURRENCY")  # Jobs in flight per worker
+    RENDER_WORKERS: int = Field(default=1, env="RENDER_WORKERS")  # Frame processes per render; 1 renders in-process
 
     # Quota settings
     MAX_CONCURRENT_JOBS_PER_USER: int = Field(default=3, env="MAX_CONCURRENT_JOBS_PER_USER")
@@ -81,9 +86,21 @@ def validate_config():
     if settings.RATE_LIMIT_PER_HOUR <= 0:
         errors.append("RATE_LIMIT_PER_HOUR must be greater than 0")
 
+    # Check LLM cache
+    if settings.LLM_CACHE_TTL <= 0:
+        errors.append("LLM_CACHE_TTL must be greater than 0")
+    if settings.LLM_CACHE_MAX_ENTRIES <= 0:
+        errors.append("LLM_CACHE_MAX_ENTRIES must be greater than 0")
+
     # Check timeouts
     if settings.REMOTION_TIMEOUT <= 0:
         errors.append("REMOTION_TIMEOUT must be greater than 0")
+    if settings.MAX_CONCURRENT_RENDERS <= 0:
+        errors.append("MAX_CONCURRENT_RENDERS must be greater than 0")
+    if settings.WORKER_CONCURRENCY <= 0:
+        errors.append("WORKER_CONCURRENCY must be greater than 0")
+    if settings.RENDER_WORKERS <= 0:
+        errors.append("RENDER_WORKERS must be greater than 0")
 
     if errors:
         error_msg = "Configuration validation failed:\n" + "\n".join(f"  - {error}" for error in errors)
@@ -1,8 +1,44 @@
 """Logging configuration for OmniVid Lite."""
+import atexit
 import logging
+import queue
 import sys
 from logging.config import dictConfig
-from typing import Dict, Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional
+
+# Background listener that owns the real (console/file) handlers
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush and stop the background log listener, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def route_through_queue(root_logger: logging.Logger) -> None:
+    """Move the root logger's handlers behind a QueueHandler.
+
+    Logging calls then only enqueue the record; console and file I/O (including
+    rotation checks) happen on a QueueListener thread. Safe to call repeatedly.
+    """
+    global _listener
+    _stop_listener()
+    handlers = [h for h in root_logger.handlers if not isinstance(h, QueueHandler)]
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging() -> None:
     """Configure logging for the application."""
@@ -36,6 +72,9 @@ def setup_logging() -> None:
         },
     }
     
+    # Drain queued records before dictConfig closes the handlers the listener writes to
+    _stop_listener()
     dictConfig(log_config)
+    route_through_queue(logging.getLogger())
     logger = logging.getLogger(__name__)
     logger.info("Logging configured successfully")
@@ -0,0 +1,11 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.db.session import DATABASE_URL
+
+# Same database file as the sync engine, driven by aiosqlite so async callers never
+# block the event loop on a database round-trip
+ASYNC_DATABASE_URL = DATABASE_URL.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False, pool_pre_ping=True)
+
+# expire_on_commit=False so returned jobs stay readable after their session closes
+async_session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
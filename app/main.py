@@ -17,6 +17,7 @@ from app.api.v1.endpoints.render import router as status_router  # status routes
 from app.api.v1.endpoints.render import router as download_router  # download routes are in render.py
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.services.llm_client import llm_client
 
 # Setup structured logging
 setup_logging()
@@ -28,12 +29,14 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan events"""
     # Startup
     logger.info("Starting OmniVid-Lite application...")
+    await llm_client.startup()
     logger.info("Application startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down OmniVid-Lite application...")
+    await llm_client.shutdown()
     logger.info("Application shutdown complete")
 
 # Initialize FastAPI app
@@ -2,7 +2,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, String, JSON, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, JSON, DateTime, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -29,6 +29,14 @@ class VideoJob(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # Partial index for the cleanup scripts' "finished and older than" predicate
+        Index(
+            "ix_video_jobs_finished_updated_at", "status", "updated_at",
+            postgresql_where=status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+        ),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model to a dictionary."""
         return {
@@ -4,6 +4,7 @@ from typing import Optional
 from sqlalchemy import select, func
 from app.db.models import Job, JobStatus
 from app.db.session import get_db_session
+from app.db.async_session import async_session_maker
 from app.core.config import settings
 import uuid
 from datetime import datetime, timedelta
@@ -116,6 +117,25 @@ def update_job_status(job_id: str, status: JobStatus, error: Optional[str] = Non
                 job.error = error
             session.commit()
 
+async def get_job_async(job_id: str) -> Optional[Job]:
+    """Get job by ID without blocking the event loop"""
+    async with async_session_maker() as session:
+        return await session.get(Job, job_id)
+
+async def update_job_status_async(job_id: str, status: JobStatus, error: Optional[str] = None,
+                                  output_path: Optional[str] = None):
+    """Update job status (and optionally its output path) without blocking the event loop"""
+    async with async_session_maker() as session:
+        async with session.begin():
+            job = await session.get(Job, job_id)
+            if job:
+                job.status = status
+                job.updated_at = datetime.utcnow()
+                if error:
+                    job.error = error
+                if output_path:
+                    job.output_path = output_path
+
 def cancel_job(job_id: str) -> bool:
     """Cancel a job if possible"""
     with get_db_session() as session:
@@ -6,12 +6,16 @@ Replaces database dependency for demo purposes.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from enum import Enum
 
+from app.utils.time_utils import utc_now
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,8 +37,8 @@ class Job:
     progress: int = 0
     output_path: Optional[str] = None
     error: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=utc_now)
+    updated_at: datetime = field(default_factory=utc_now)
     user_id: str = "demo_user"
     creative: bool = False
 
@@ -45,6 +49,38 @@ class InMemoryJobStore:
     def __init__(self):
         self.jobs: Dict[str, Job] = {}
         self._lock = asyncio.Lock()
+        # Set whenever a job is enqueued so idle workers wake immediately instead of polling
+        self._job_available = asyncio.Event()
+        # Min-heap of (created_at, seq, job) for jobs entering PENDING. Entries go stale
+        # when their job leaves PENDING; claim_next_job skips them when popped, and the
+        # heap is compacted once stale entries make up half of it
+        self._pending: List[Tuple[datetime, int, Job]] = []
+        self._pending_seq = itertools.count()
+        self._stale_pending = 0
+
+    def _push_pending(self, job: Job) -> None:
+        heapq.heappush(self._pending, (job.created_at, next(self._pending_seq), job))
+
+    def _set_status(self, job: Job, status: JobStatus) -> None:
+        """Change a job's status, keeping the pending heap in step."""
+        was_pending = job.status == JobStatus.PENDING
+        job.status = status
+        if status == JobStatus.PENDING and not was_pending:
+            self._push_pending(job)
+        elif was_pending and status != JobStatus.PENDING:
+            # Its heap entry is now stale
+            self._stale_pending += 1
+            if self._stale_pending * 2 > len(self._pending):
+                self._compact_pending()
+
+    def _compact_pending(self) -> None:
+        """Drop heap entries for jobs that are no longer pending or no longer stored."""
+        self._pending = [
+            entry for entry in self._pending
+            if entry[2].status == JobStatus.PENDING and self.jobs.get(entry[2].id) is entry[2]
+        ]
+        heapq.heapify(self._pending)
+        self._stale_pending = 0
 
     async def create_job(self, job_id: str, prompt: str, user_id: str = "demo_user", creative: bool = False) -> Job:
         """Create a new job."""
@@ -57,9 +93,49 @@ class InMemoryJobStore:
                 status=JobStatus.PENDING
             )
             self.jobs[job_id] = job
+            self._push_pending(job)
+            self._job_available.set()
             logger.info(f"Created job {job_id} with prompt: {prompt}")
             return job
 
+    async def claim_next_job(self) -> Optional[Job]:
+        """Atomically take the oldest pending job and mark it as processing.
+
+        Selection and the status change happen under one lock acquisition, so two
+        workers can never claim the same job.
+        """
+        async with self._lock:
+            while self._pending:
+                _, _, job = heapq.heappop(self._pending)
+                # Skip stale entries: claimed, cancelled, replaced or cleaned up since
+                if job.status == JobStatus.PENDING and self.jobs.get(job.id) is job:
+                    break
+                self._stale_pending = max(0, self._stale_pending - 1)
+            else:
+                return None
+
+            job.status = JobStatus.PROCESSING
+            job.updated_at = utc_now()
+            logger.info(f"Updated job {job.id} status to {job.status.value}")
+            return job
+
+    async def wait_for_job(self, timeout: Optional[float] = None) -> bool:
+        """Wait until a job is enqueued (or notify_job_available is called).
+
+        Returns False if the timeout expired first.
+        """
+        try:
+            await asyncio.wait_for(self._job_available.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._job_available.clear()
+        return True
+
+    def notify_job_available(self) -> None:
+        """Wake workers blocked in wait_for_job."""
+        self._job_available.set()
+
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
         async with self._lock:
@@ -72,9 +148,9 @@ class InMemoryJobStore:
             if not job:
                 return False
 
-            job.status = status
+            self._set_status(job, status)
             job.error = error
-            job.updated_at = datetime.now()
+            job.updated_at = utc_now()
 
             logger.info(f"Updated job {job_id} status to {status.value}")
             if error:
@@ -92,7 +168,7 @@ class InMemoryJobStore:
             job.progress = min(100, max(0, progress))
             if output_path:
                 job.output_path = output_path
-            job.updated_at = datetime.now()
+            job.updated_at = utc_now()
 
             logger.info(f"Updated job {job_id} progress to {progress}%")
             if output_path:
@@ -100,6 +176,22 @@ class InMemoryJobStore:
 
             return True
 
+    async def complete_job(self, job_id: str, output_path: str) -> bool:
+        """Mark a job completed at 100% with its output, as one update with one timestamp."""
+        async with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return False
+
+            self._set_status(job, JobStatus.COMPLETED)
+            job.progress = 100
+            job.output_path = output_path
+            job.error = None
+            job.updated_at = utc_now()
+
+            logger.info(f"Job {job_id} completed, output: {output_path}")
+            return True
+
     async def list_jobs(self, user_id: str, limit: int = 50) -> list[Job]:
         """List jobs for a user."""
         async with self._lock:
@@ -115,14 +207,14 @@ class InMemoryJobStore:
             if not job or job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
                 return False
 
-            job.status = JobStatus.CANCELLED
-            job.updated_at = datetime.now()
+            self._set_status(job, JobStatus.CANCELLED)
+            job.updated_at = utc_now()
             logger.info(f"Cancelled job {job_id}")
             return True
 
     async def cleanup_old_jobs(self, days_old: int = 7) -> int:
         """Cleanup old completed/failed jobs."""
-        cutoff_date = datetime.now()
+        cutoff_date = utc_now()
         async with self._lock:
             to_remove = []
             for job_id, job in self.jobs.items():
@@ -132,6 +224,7 @@ class InMemoryJobStore:
 
             for job_id in to_remove:
                 del self.jobs[job_id]
+            self._compact_pending()
 
             logger.info(f"Cleaned up {len(to_remove)} old jobs")
             return len(to_remove)
@@ -0,0 +1,52 @@
+# app/services/llm_cache.py
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.core.config import settings
+
+
+class LLMCache:
+    """Exact-match cache of generated DSL, keyed on a hash of the request"""
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (expires_at, dsl); ordered oldest-used first for LRU eviction
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @staticmethod
+    def make_key(prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+        payload = json.dumps(
+            {"prompt": prompt, "model": model, "temp": temperature, "max_tokens": max_tokens},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, dsl = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Callers mutate the DSL they get back; hand out a private copy
+        return copy.deepcopy(dsl)
+
+    async def set(self, key: str, dsl: dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(dsl))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# export singleton
+llm_cache = LLMCache(settings.LLM_CACHE_TTL, settings.LLM_CACHE_MAX_ENTRIES)
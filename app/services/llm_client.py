@@ -7,9 +7,19 @@ import logging
 from typing import Optional
 from app.core.config import settings
 from app.services.errors import LLMError
+from app.services.llm_cache import llm_cache
+from app.utils.json_utils import loads_json
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every Ollama call so jobs skip the connect/TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+
+
+class _FallbackDSL(dict):
+    """DSL patched together after the model's output failed validation; never cached"""
+
+
 class LLMClient:
     def __init__(self):
         self.use_local = bool(settings.USE_LOCAL_LLM)
@@ -17,11 +27,40 @@ class LLMClient:
         self.ollama_model = settings.OLLAMA_MODEL
         self.openai_key = settings.OPENAI_API_KEY
         self.openai_model = settings.OPENAI_MODEL
+        # Created lazily on first use and reused across jobs; closed by shutdown()
+        self._http: Optional[httpx.AsyncClient] = None
+        self._openai = None
+
+    async def startup(self):
+        """Open the pooled HTTP client ahead of the first request"""
+        self._http_client()
+
+    async def shutdown(self):
+        """Close pooled connections"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._openai is not None:
+            await self._openai.close()
+            self._openai = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=60, limits=HTTP_LIMITS)
+        return self._http
+
+    def _openai_client(self):
+        if self._openai is None:
+            from openai import AsyncOpenAI
+            self._openai = AsyncOpenAI(api_key=self.openai_key)
+        return self._openai
 
-    async def generate_dsl(self, user_prompt: str, temperature: float = 0.2, max_tokens: int = 1500, max_retries: int = 2) -> dict:
+    async def generate_dsl(self, user_prompt: str, temperature: float = 0.2, max_tokens: int = 1500, max_retries: int = 2,
+                           use_cache: bool = True) -> dict:
         """
         Return parsed JSON (DSL). Caller expects a dict.
         Implements robust error handling with proper fallbacks, timeouts, and retry logic.
+        Pass use_cache=False to always reach the model (health checks).
         """
         # Validate input
         if not user_prompt or len(user_prompt.strip()) < 10:
@@ -30,6 +69,33 @@ class LLMClient:
         if len(user_prompt) > 1000:
             raise LLMError("Prompt too long (maximum 1000 characters)")
 
+        if not use_cache:
+            return await self._generate_uncached(user_prompt, temperature, max_tokens, max_retries)
+
+        # Identical requests reuse the DSL generated last time
+        cache_key = llm_cache.make_key(user_prompt, self._model_id(), temperature, max_tokens)
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info("LLM cache hit, skipping model call")
+            return cached
+
+        dsl = await self._generate_uncached(user_prompt, temperature, max_tokens, max_retries)
+        # A fallback stands in for one bad reply; the next attempt may well validate
+        if not isinstance(dsl, _FallbackDSL):
+            await llm_cache.set(cache_key, dsl)
+        return dsl
+
+    def _model_id(self) -> str:
+        """Identify the backends that could serve a request, for cache keying"""
+        models = []
+        if self.use_local:
+            models.append(f"ollama:{self.ollama_model}")
+        if self.openai_key:
+            models.append(f"openai:{self.openai_model}")
+        return "|".join(models)
+
+    async def _generate_uncached(self, user_prompt: str, temperature: float, max_tokens: int, max_retries: int) -> dict:
+        """Call the configured backends, local first, with retries and fallback"""
         prompt = self._full_prompt(user_prompt)
         last_error = None
 
@@ -113,17 +179,15 @@ class LLMClient:
             "max_tokens": max_tokens,
             "temperature": temperature
         }
-        async with httpx.AsyncClient(timeout=60) as client:
-            r = await client.post(url, json=payload)
-            r.raise_for_status()
-            data = r.json()
-            # Ollama response shape may vary; adapt as needed:
-            text = data.get("response") or data.get("text") or ""
-            return self._extract_json_from_text(text)
+        r = await self._http_client().post(url, json=payload)
+        r.raise_for_status()
+        data = r.json()
+        # Ollama response shape may vary; adapt as needed:
+        text = data.get("response") or data.get("text") or ""
+        return self._extract_json_from_text(text)
 
     async def _call_openai(self, prompt: str, temperature: float, max_tokens: int) -> dict:
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=self.openai_key)
+        client = self._openai_client()
         # using ChatCompletions
         resp = await client.chat.completions.create(
             model=self.openai_model,
@@ -157,23 +221,24 @@ class LLMClient:
                 text = text[start:end+1]
 
         try:
-            parsed_json = json.loads(text)
+            parsed_json = loads_json(text)
         except json.JSONDecodeError as e:
             logger.warning(f"JSON parsing failed: {e}")
             raise ValueError(f"LLM output is not valid JSON: {e}\nRAW:{text[:500]}")
 
         # Validate against scene schema
         try:
-            validated_dsl = DSLModel(**parsed_json)
+            # model_validate feeds the dict straight to the compiled validator
+            validated_dsl = DSLModel.model_validate(parsed_json)
             logger.info("Scene DSL validation successful")
-            return validated_dsl.dict()
+            return validated_dsl.model_dump()
         except ValidationError as e:
             logger.warning(f"Scene schema validation failed: {e}")
             # Try to create a minimal valid fallback
             fallback_dsl = self._create_fallback_dsl(parsed_json)
             if fallback_dsl:
                 logger.info("Using fallback DSL after validation failure")
-                return fallback_dsl
+                return _FallbackDSL(fallback_dsl)
             else:
                 raise ValueError(f"LLM output doesn't match expected scene format: {e}\nRAW:{text[:500]}")
 
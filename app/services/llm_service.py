@@ -20,7 +20,7 @@ class LLMService:
     def __init__(self):
         self.model = "gpt-4o-mini"  # Default model
 
-    async def validate_prompt(self, prompt: str) -> bool:
+    def validate_prompt(self, prompt: str) -> bool:
         """Validate prompt length and content"""
         if not prompt or len(prompt.strip()) < 10:
             return False
@@ -2,6 +2,7 @@
 import asyncio
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
@@ -14,12 +15,19 @@ from app.schemas.dsl_schema import VideoDSL
 from app.services.errors import LLMError, DSLTransformError, RenderError
 from app.services.llm_client import llm_client
 from app.services.logging_service import audit_logger
+from app.utils.json_utils import dump_json_bytes
 
 OUTPUT_DIR = settings.OUTPUT_DIR
 GENERATED_SRC = settings.REMOTION_DIR / "src" / "generated"
 GENERATED_SRC.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Remotion renders block a thread on the node subprocess for their whole duration; keep
+# them on a bounded pool of their own so they cannot exhaust the loop's default executor.
+# The threads only wait on node (the GIL is released), so the pool size is the number of
+# renders node runs side by side
+_render_pool = ThreadPoolExecutor(max_workers=settings.MAX_CONCURRENT_RENDERS, thread_name_prefix="remotion-render")
+
 class PipelineStage(Enum):
     START = "start"
     LLM = "llm"
@@ -41,7 +49,7 @@ def save_status(job_dir: Path, stage: PipelineStage, logs: list):
         "updated_at": datetime.now().isoformat(),
         "logs": logs
     }
-    status_path.write_text(json.dumps(status_data, indent=2), encoding="utf-8")
+    status_path.write_bytes(dump_json_bytes(status_data))
 
 def load_status(job_dir: Path):
     status_path = job_dir / "status.json"
@@ -50,8 +58,9 @@ def load_status(job_dir: Path):
     return {"stage": PipelineStage.START.value, "logs": []}
 
 async def run_pipeline(prompt: str, job_id: str, creative: bool = False):
+    # GENERATED_SRC is created at import, so only the leaf directory is made per job
     job_dir = GENERATED_SRC / job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
+    job_dir.mkdir(exist_ok=True)
 
     status = load_status(job_dir)
     current_stage = PipelineStage(status.get("stage", "start"))
@@ -77,12 +86,13 @@ async def run_pipeline(prompt: str, job_id: str, creative: bool = False):
         # TSX Generation Stage
         if current_stage.value in [PipelineStage.VALIDATED.value, PipelineStage.LLM.value, PipelineStage.START.value]:
             dsl_path = job_dir / "scene.json"
-            dsl_path.write_text(json.dumps(dsl, indent=2), encoding="utf-8")
+            dsl_path.write_bytes(dump_json_bytes(dsl))
 
             logs.append(log_entry("tsx", "🛠 Converting DSL → TSX..."))
             # Use unique component name per job to prevent conflicts
             component_name = f"GeneratedScene_{job_id}"
-            tsx_path = GENERATED_SRC / f"{component_name}.tsx"
+            # render_remotion registers ./generated/<job_id>/GeneratedScene
+            tsx_path = job_dir / "GeneratedScene.tsx"
             scene_to_tsx(str(dsl_path), str(tsx_path), component_name)
             save_status(job_dir, PipelineStage.TSX, logs)
             current_stage = PipelineStage.TSX
@@ -92,7 +102,8 @@ async def run_pipeline(prompt: str, job_id: str, creative: bool = False):
             logs.append(log_entry("render", "🎬 Rendering..."))
             component_name = f"GeneratedScene_{job_id}"
             output_file = OUTPUT_DIR / f"{job_id}.mp4"
-            await asyncio.to_thread(render_remotion, component_name, str(output_file))
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_render_pool, render_remotion, component_name, str(output_file), job_id)
             save_status(job_dir, PipelineStage.RENDERED, logs)
 
         logs.append(log_entry("done", "✅ Done."))
@@ -1,21 +1,17 @@
 # app/services/remotion_adapter.py
+import asyncio
+import itertools
+import json
 import subprocess
 from pathlib import Path
+from typing import Optional, Set
 from app.core.config import settings
 from app.services.errors import RenderError
 
 REMOTION_ROOT = settings.REMOTION_DIR
 
-def render_remotion(composition_id: str, output_path: str, job_dir: str) -> None:
-    """
-    Deterministically renders a Remotion composition with proper registration and build.
-
-    Args:
-        composition_id: Unique identifier for the composition (e.g., "Scene_abcd1234")
-        output_path: Path to output video file
-        job_dir: Relative path to job directory containing GeneratedScene.tsx
-    """
-    # Step 1: Register the generated component in index.tsx
+def _register_composition(composition_id: str, job_dir: str) -> None:
+    """Add the job's GeneratedScene to src/index.tsx unless it is already registered"""
     index_path = REMOTION_ROOT / "src" / "index.tsx"
     index_content = index_path.read_text(encoding="utf-8")
 
@@ -50,6 +46,19 @@ def render_remotion(composition_id: str, output_path: str, job_dir: str) -> None
         # Write back
         index_path.write_text(index_content, encoding="utf-8")
 
+
+def render_remotion(composition_id: str, output_path: str, job_dir: str) -> None:
+    """
+    Deterministically renders a Remotion composition with proper registration and build.
+
+    Args:
+        composition_id: Unique identifier for the composition (e.g., "Scene_abcd1234")
+        output_path: Path to output video file
+        job_dir: Relative path to job directory containing GeneratedScene.tsx
+    """
+    # Step 1: Register the generated component in index.tsx
+    _register_composition(composition_id, job_dir)
+
     # Step 2: Skip build - render script handles bundling
 
     # Step 3: Render the specific composition
@@ -86,3 +95,120 @@ def render_remotion(composition_id: str, output_path: str, job_dir: str) -> None
         raise RenderError(f"Remotion render timed out after {settings.REMOTION_TIMEOUT} seconds")
     except FileNotFoundError as e:
         raise RenderError(f"Remotion command not found: {settings.REMOTION_CMD} - {e}")
+
+
+class RemotionPool:
+    """Pool of long-lived scripts/render_server.js processes.
+
+    Each server keeps its browser open and its bundle cached between renders
+    (re-bundling only when src/ changes), so repeat renders skip straight to
+    frame rendering. Servers start lazily and are handed out one render at a time.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: Optional[asyncio.Queue] = None
+        # Every live server, idle or busy, so close() can reach all of them
+        self._procs: Set[asyncio.subprocess.Process] = set()
+        self._request_ids = itertools.count()
+
+    async def _start_server(self) -> asyncio.subprocess.Process:
+        script = REMOTION_ROOT / "scripts" / "render_server.js"
+        proc = await asyncio.create_subprocess_exec(
+            "node", str(script),
+            cwd=str(REMOTION_ROOT),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        self._procs.add(proc)
+        return proc
+
+    async def _kill(self, proc: asyncio.subprocess.Process) -> None:
+        self._procs.discard(proc)
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    async def render(self, composition_id: str, output_path: str, job_dir: str) -> None:
+        """Render a composition on an idle server; raises RenderError on failure."""
+        if self._idle is None:
+            # Slots start empty (None) and get a server on first use
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(None)
+        # Hold on to this queue: close() may drop the pool's while we render
+        idle = self._idle
+
+        _register_composition(composition_id, job_dir)
+
+        proc = await idle.get()
+        try:
+            if proc is None or proc.returncode is not None:
+                if proc is not None:
+                    self._procs.discard(proc)
+                proc = await self._start_server()
+
+            request_id = next(self._request_ids)
+            request = {"id": request_id, "comp": composition_id, "out": str(output_path)}
+            proc.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            await proc.stdin.drain()
+
+            try:
+                line = await asyncio.wait_for(proc.stdout.readline(), timeout=settings.REMOTION_TIMEOUT)
+            except asyncio.TimeoutError:
+                await self._kill(proc)
+                raise RenderError(f"Remotion render timed out after {settings.REMOTION_TIMEOUT} seconds")
+            if not line:
+                raise RenderError(f"Remotion render server exited (code={proc.returncode})")
+
+            try:
+                result = json.loads(line)
+            except ValueError:  # not JSON, or not even UTF-8
+                result = None
+            if not isinstance(result, dict):
+                # Stray stdout output; whatever follows it is out of step too
+                await self._kill(proc)
+                raise RenderError(f"Remotion render server sent an invalid reply: {line[:200]!r}")
+            if result.get("id") != request_id:
+                # Out of step with the server; its later replies cannot be trusted either
+                await self._kill(proc)
+                raise RenderError(
+                    f"Remotion render server answered request {result.get('id')}, expected {request_id}"
+                )
+            if not result.get("ok"):
+                raise RenderError(f"Remotion render failed: {result.get('error')}")
+        except asyncio.CancelledError:
+            # The server is still busy with this request; its reply would reach the next caller
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+            self._procs.discard(proc)
+            # Not reaped yet, so hand back an empty slot rather than the killed handle
+            proc = None
+            raise
+        finally:
+            # Dead servers go back as their handle and are replaced on next use
+            idle.put_nowait(proc)
+
+    async def close(self) -> None:
+        """Shut down every started server; busy ones are killed mid-render."""
+        if self._idle is None:
+            return
+        idle_procs = set()
+        while not self._idle.empty():
+            idle_procs.add(self._idle.get_nowait())
+        self._idle = None
+
+        procs, self._procs = self._procs, set()
+        for proc in procs:
+            if proc.returncode is not None:
+                continue
+            if proc in idle_procs:
+                # Closing stdin lets the server close its browser and exit
+                proc.stdin.close()
+            else:
+                proc.kill()
+        await asyncio.gather(*(proc.wait() for proc in procs))
+
+
+# export singleton
+remotion_pool = RemotionPool(settings.MAX_CONCURRENT_RENDERS)
@@ -1,4 +1,5 @@
 # app/services/scene_to_tsx.py
+import hashlib
 import json
 from pathlib import Path
 from ..core.config import settings
@@ -24,10 +25,20 @@ def _fetch_asset(url: str) -> str:
             shutil.copy(src, dest)
     return f"/public/{fname}"
 
+# Hash of the DSL and component name last generated into a directory
+CODEGEN_STAMP = ".codegen.sha256"
+
 def scene_to_tsx(dsl_path: str, tsx_path: str, component_name: str = "GeneratedScene"):
-    with open(dsl_path, 'r') as f:
-        dsl = json.load(f)
+    dsl_bytes = Path(dsl_path).read_bytes()
     out_dir = Path(tsx_path).parent
+    # Same DSL into the same component: the generated files (and fetched assets) are
+    # already in place, so only re-point MainVideo at this component
+    digest = hashlib.sha256(dsl_bytes + component_name.encode("utf-8")).hexdigest()
+    stamp_file = out_dir / CODEGEN_STAMP
+    if Path(tsx_path).exists() and stamp_file.exists() and stamp_file.read_text(encoding="utf-8") == digest:
+        _write_main_video(component_name)
+        return
+    dsl = json.loads(dsl_bytes)
     generate_remotion_from_dsl(dsl, out_dir, component_name)
     # rename Scene.tsx to the specified component name
     scene_file = out_dir / "Scene.tsx"
@@ -35,6 +46,7 @@ def scene_to_tsx(dsl_path: str, tsx_path: str, component_name: str = "GeneratedS
     if scene_file.exists():
         generated_file.unlink(missing_ok=True)
         scene_file.rename(generated_file)
+    stamp_file.write_text(digest, encoding="utf-8")
 
 def generate_remotion_from_dsl(dsl: dict, out_dir: Path, component_name: str = "GeneratedScene"):
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -70,6 +82,9 @@ export default {component_name};
     tmp_file.replace(scene_path)
 
     # 2) Build MainVideo.tsx that wraps the component composition as Main
+    _write_main_video(component_name)
+
+def _write_main_video(component_name: str):
     main_path = settings.REMOTION_DIR / "src" / "MainVideo.tsx"
     main_tsx = f"""
 import React from 'react';
@@ -81,4 +96,6 @@ export const MainVideo = (props) => {{
 
 export default MainVideo;
 """
-    main_path.write_text(main_tsx, encoding="utf-8")
+    # Skip the write when unchanged so the bundler's cache stays valid
+    if not main_path.exists() or main_path.read_text(encoding="utf-8") != main_tsx:
+        main_path.write_text(main_tsx, encoding="utf-8")
@@ -6,12 +6,23 @@ Creates simple text animations using OpenCV and Pillow.
 """
 
 import os
+import math
+import shutil
+import queue
 import logging
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial, lru_cache
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Literal
 import cv2
 import numpy as np
 
+from app.core.config import settings
+
 # Try to import PIL, fallback to OpenCV-only rendering if not available
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -20,14 +31,178 @@ except ImportError:
     HAS_PILLOW = False
     print("WARNING: Pillow not available, using OpenCV-only text rendering")
 
+# Numba is optional; without it the vibrant background uses the NumPy path
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Render quality presets: (width, height, fps)
+QUALITY_PRESETS = {
+    'preview': (1280, 720, 24),
+    'full': (1920, 1080, 30),
+}
+
+
+# ffmpeg video codec arguments, hardware encoder first
+NVENC_CODEC_ARGS = ['-c:v', 'h264_nvenc', '-preset', 'p4', '-cq', '23']
+X264_CODEC_ARGS = ['-c:v', 'libx264', '-preset', 'veryfast']
+
+# float32 constants shared by the Numba kernel, matching the NumPy path's float32 math
+_F32_2, _F32_4 = np.float32(2), np.float32(4)
+_F32_127, _F32_128 = np.float32(127), np.float32(128)
+_F32_ROW_STEP, _F32_DIAG_STEP = np.float32(0.01), np.float32(0.005)
+
+if HAS_NUMBA:
+    # Serial on purpose: renders run on several worker threads at once, and numba's default
+    # workqueue threading layer aborts the process on concurrent parallel-kernel calls
+    @numba.njit(cache=True)
+    def _vibrant_kernel(out, time_phase):
+        """Fill out (H, W, 3) uint8 with the vibrant gradient in a single fused pass.
+
+        Phases and sines are float32, as in the NumPy path, so both give the same pixels.
+        """
+        height, width = out.shape[0], out.shape[1]
+        phase0 = np.float32(time_phase)
+        # Channel 0 only varies along x and channel 2 only along x + y; tabulate both once
+        row = np.empty(width, dtype=np.uint8)
+        for x in range(width):
+            row[x] = np.uint8(_F32_128 + _F32_127 * np.sin(phase0 + np.float32(x) * _F32_ROW_STEP))
+        diag = np.empty(width + height - 1, dtype=np.uint8)
+        for d in range(width + height - 1):
+            diag[d] = np.uint8(_F32_128 + _F32_127 * np.sin(phase0 + np.float32(d) * _F32_DIAG_STEP + _F32_4))
+        for y in range(height):
+            col = np.uint8(_F32_128 + _F32_127 * np.sin(phase0 + np.float32(y) * _F32_ROW_STEP + _F32_2))
+            for x in range(width):
+                out[y, x, 0] = row[x]
+                out[y, x, 1] = col
+                out[y, x, 2] = diag[x + y]
+
+# Per-process frame generator installed by _init_frame_worker
+_frame_fn = None
+
+
+def _init_frame_worker(frame_fn: Callable):
+    """Install the frame generator in a render worker process."""
+    global _frame_fn
+    _frame_fn = frame_fn
+
+
+def _render_frame_in_worker(frame_number: int) -> np.ndarray:
+    """Render a single frame inside a render worker process."""
+    return _frame_fn(frame_number)
+
+
+@lru_cache(maxsize=1)
+def _has_nvenc() -> bool:
+    """Check once whether ffmpeg can actually encode with h264_nvenc on this machine."""
+    probe_cmd = [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+        *NVENC_CODEC_ARGS, '-f', 'null', '-',
+    ]
+    try:
+        return subprocess.run(probe_cmd, capture_output=True, timeout=15).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+class FFmpegVideoWriter:
+    """cv2.VideoWriter-compatible writer that pipes raw BGR frames straight into ffmpeg.
+
+    Encodes H.264 in a single pass with ``+faststart`` so the MP4 is web-playable
+    without a post-processing rewrite. Uses NVENC when available, libx264 otherwise.
+    """
+
+    def __init__(self, output_path: str, fps: int, size: tuple, codec_args: Optional[list] = None):
+        width, height = size
+        if codec_args is None:
+            codec_args = NVENC_CODEC_ARGS if _has_nvenc() else X264_CODEC_ARGS
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+            '-an', *codec_args, '-pix_fmt', 'yuv420p',
+            '-movflags', '+faststart', output_path,
+        ]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def isOpened(self) -> bool:
+        return self._proc.poll() is None
+
+    def write(self, frame: np.ndarray):
+        self._proc.stdin.write(np.ascontiguousarray(frame).data)
+
+    def release(self):
+        try:
+            if self._proc.stdin and not self._proc.stdin.closed:
+                self._proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass  # ffmpeg already exited; its stderr and exit code below say why
+        finally:
+            stderr = self._proc.stderr.read().decode(errors='ignore') if self._proc.stderr else ''
+            returncode = self._proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self._proc.returncode}: {stderr[:500]}")
+
+
+class ThreadedFrameWriter:
+    """Hand frames to a video writer on a background thread.
+
+    ``write`` only enqueues, so frame rendering overlaps with encoding; the bounded
+    queue applies back-pressure once the encoder falls ``maxsize`` frames behind.
+    Frames must not be mutated after they are written.
+    """
+
+    def __init__(self, video_writer, maxsize: int):
+        self._writer = video_writer
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, name='frame-writer', daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            if self._error is not None:
+                continue  # keep draining so the producer never blocks on a dead writer
+            try:
+                self._writer.write(frame)
+            except Exception as e:
+                self._error = e
+
+    def isOpened(self) -> bool:
+        return self._writer.isOpened()
+
+    def write(self, frame: np.ndarray):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(frame)
+
+    def release(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._writer.release()
+        if self._error is not None:
+            raise self._error
+
 
 class EnhancedVideoRenderer:
     """Enhanced video renderer with advanced text effects and motion graphics."""
 
-    def __init__(self, width=1920, height=1080, fps=30, duration=5):
+    def __init__(self, width=1280, height=720, fps=30, duration=5, workers: int = 1):
         self.font_path = self._find_font()
+        # Frame process pool is opt-in (settings.RENDER_WORKERS): frames are cheap to draw
+        # but costly to pickle back, and renders already run side by side on render threads
+        self.workers = max(1, workers)
+        self._font_cache = {}
+        self._text_mask_cache = {}
+        self._prefix_width_cache = {}
         self.width = width
         self.height = height
         self.fps = fps
@@ -39,6 +214,8 @@ class EnhancedVideoRenderer:
         self.visual_style = 'minimal'  # minimal, vibrant, cinematic, abstract
         self.text_animation = 'fade'  # fade, slide, bounce, typewriter
 
+        self._rebuild_caches()
+
     def set_parameters(self, duration=None, resolution=None, style=None, animation=None):
         """Set video generation parameters."""
         if duration:
@@ -59,6 +236,128 @@ class EnhancedVideoRenderer:
         if animation:
             self.text_animation = animation
 
+        self._rebuild_caches()
+
+    def set_quality(self, quality: Literal['preview', 'full']):
+        """Apply a render quality preset (720p/24fps preview or 1080p/30fps full).
+
+        Changes this renderer's size and fps for every later render; pass ``quality`` to
+        ``create_text_video`` instead to apply a preset to one render only.
+        """
+        if quality not in QUALITY_PRESETS:
+            raise ValueError(f"Unknown quality preset: {quality}")
+        self.width, self.height, self.fps = QUALITY_PRESETS[quality]
+        self.total_frames = int(self.duration * self.fps)
+        self._rebuild_caches()
+
+    @contextmanager
+    def _quality_preset(self, quality: Optional[Literal['preview', 'full']]):
+        """Apply a quality preset for the duration of one render, then restore size and fps."""
+        if not quality:
+            yield
+            return
+        saved = (self.width, self.height, self.fps, self.total_frames)
+        self.set_quality(quality)
+        try:
+            yield
+        finally:
+            self.width, self.height, self.fps, self.total_frames = saved
+            self._rebuild_caches()
+
+    def _rebuild_caches(self):
+        """Precompute frame-invariant buffers for the current size and style."""
+        # Scratch frame every animated background is drawn into; reused from frame to frame
+        self._frame_buf = np.empty((self.height, self.width, 3), dtype=np.uint8)
+
+        # Styles whose background is identical on every frame share one read-only frame
+        self._is_bg_static = self.visual_style in ('minimal', 'cinematic')
+        self._static_bg = None
+        if self.visual_style == 'minimal':
+            # Clean black background
+            self._static_bg = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+        if self.visual_style == 'cinematic':
+            # Dark base with a subtle vignette; depends only on width/height
+            base_color = 20
+            center_y, center_x = self.height // 2, self.width // 2
+            y_coords, x_coords = np.ogrid[:self.height, :self.width]
+            # dist / max_dist == sqrt(dist^2 / max_dist^2): one sqrt over normalized squared distance
+            dist_sq = (y_coords - center_y)**2 + (x_coords - center_x)**2
+            max_dist_sq = float(center_y**2 + center_x**2)
+            vignette = 1 - 0.3 * np.sqrt(dist_sq / max_dist_sq)
+            frame = np.full((self.height, self.width, 3), base_color, dtype=np.uint8)
+            self._static_bg = (frame * vignette[:, :, np.newaxis]).astype(np.uint8)
+
+        if self._static_bg is not None:
+            self._static_bg.flags.writeable = False
+
+        self._sin_buf = None
+        if self.visual_style == 'vibrant':
+            # One phase slot per column (channel 0), row (channel 1) and x + y diagonal (channel 2)
+            self._sin_buf = np.empty(self.width + self.height + (self.width + self.height - 1), dtype=np.float32)
+
+        self._abstract_table = None
+        if self.visual_style == 'abstract':
+            # Per-frame circle centers, radii and colors; the shapes only depend on frame_number
+            time_factor = (np.arange(self.total_frames) / self.total_frames)[:, np.newaxis]
+            idx = np.arange(5)
+            cx = (self.width * (0.2 + 0.6 * np.sin(time_factor * 2 + idx))).astype(np.int32)
+            cy = (self.height * (0.2 + 0.6 * np.cos(time_factor * 1.5 + idx))).astype(np.int32)
+            radius = (50 + 30 * np.sin(time_factor * 3 + idx)).astype(np.int32)
+            colors = np.stack([(100 + 155 * np.sin(time_factor + idx + k)).astype(np.int32)
+                               for k in (0, 2, 4)], axis=-1)
+            self._abstract_table = (cx.tolist(), cy.tolist(), radius.tolist(), colors.tolist())
+
+    def _generate_frames(self, frame_fn: Callable):
+        """
+        Yield frame_fn(0..total_frames-1) in order.
+
+        Frames have no inter-frame state, so with workers > 1 they are rendered in a
+        process pool. At most a writer queue's worth of frames is in flight ahead of the
+        writer, so memory stays bounded at any resolution.
+        """
+        if self.workers <= 1 or self.total_frames < 2 * self.workers:
+            for frame_number in range(self.total_frames):
+                yield frame_fn(frame_number)
+            return
+
+        max_in_flight = max(self.workers, self._writer_queue_size())
+        in_flight = deque()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_frame_worker,
+                                 initargs=(frame_fn,)) as executor:
+            for frame_number in range(self.total_frames):
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+                in_flight.append(executor.submit(_render_frame_in_worker, frame_number))
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def _writer_queue_size(self) -> int:
+        """Frames the writer thread buffers ahead of the encoder (two seconds of video)."""
+        return self.fps * 2
+
+    def _open_video_writer(self, output_path: str):
+        """Open an ffmpeg pipe writer (OpenCV mp4v when ffmpeg is missing) behind a writer thread."""
+        if shutil.which('ffmpeg'):
+            video_writer = FFmpegVideoWriter(output_path, self.fps, (self.width, self.height))
+        else:
+            logger.warning("ffmpeg not found, falling back to OpenCV mp4v encoding")
+            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+            video_writer = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
+
+        if not video_writer.isOpened():
+            raise Exception("Failed to initialize video writer")
+        return ThreadedFrameWriter(video_writer, maxsize=self._writer_queue_size())
+
+    def _discard_partial_output(self, video_writer, output_path: str):
+        """Release a writer after a failed render and remove the partial file."""
+        if video_writer is not None:
+            try:
+                video_writer.release()
+            except Exception:
+                pass
+        Path(output_path).unlink(missing_ok=True)
+
     def _find_font(self) -> Optional[str]:
         """Find a system font for text rendering."""
         # Try common font paths
@@ -76,80 +375,158 @@ class EnhancedVideoRenderer:
         logger.warning("No system font found, using default")
         return None
 
-    def create_background(self, frame_number: int) -> np.ndarray:
-        """Create animated background based on visual style."""
-        if self.visual_style == 'minimal':
-            # Clean black background
-            return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+    def _get_font(self, size: int):
+        """Return a (cached) font of the given size, loading it on first use."""
+        font = self._font_cache.get(size)
+        if font is None:
+            try:
+                if self.font_path:
+                    font = ImageFont.truetype(self.font_path, size)
+                else:
+                    font = ImageFont.load_default()
+            except:
+                font = ImageFont.load_default()
+            self._font_cache[size] = font
+        return font
 
-        elif self.visual_style == 'vibrant':
-            # Color gradient background
-            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-            # Create a moving color gradient
-            time_factor = frame_number / self.total_frames
-            for y in range(self.height):
-                for x in range(self.width):
-                    r = int(128 + 127 * np.sin(time_factor * 4 + x * 0.01))
-                    g = int(128 + 127 * np.sin(time_factor * 4 + y * 0.01 + 2))
-                    b = int(128 + 127 * np.sin(time_factor * 4 + (x + y) * 0.005 + 4))
-                    frame[y, x] = [r, g, b]
+    def _get_text_mask(self, text: str, font_size: int) -> tuple:
+        """Return a cached (coverage mask, bbox) pair for text rasterized at the given size.
+
+        The mask is a float32 (h, w) array in [0, 1] covering only the glyph bounding box;
+        bbox is the text bounding box relative to the draw origin, as ``draw.textbbox`` reports it.
+        """
+        key = (text, font_size)
+        cached = self._text_mask_cache.get(key)
+        if cached is None:
+            font = self._get_font(font_size)
+            # draw.textbbox measures every line of multiline text; font.getbbox only the first
+            measure = ImageDraw.Draw(Image.new('L', (1, 1)))
+            bbox = measure.textbbox((0, 0), text, font=font) if text else (0, 0, 0, 0)
+            width, height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+            if width > 0 and height > 0:
+                mask_image = Image.new('L', (width, height), 0)
+                ImageDraw.Draw(mask_image).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+                mask = np.asarray(mask_image, dtype=np.float32) / 255.0
+            else:
+                mask = np.zeros((0, 0), dtype=np.float32)
+            cached = self._text_mask_cache[key] = (mask, bbox)
+        return cached
+
+    def _get_prefix_widths(self, text: str, font_size: int) -> list:
+        """Return cached advance widths of text[:n] for n = 0..len(text), used to reveal text progressively."""
+        key = (text, font_size)
+        widths = self._prefix_width_cache.get(key)
+        if widths is None:
+            font = self._get_font(font_size)
+            widths = [int(round(font.getlength(text[:n]))) for n in range(len(text) + 1)]
+            self._prefix_width_cache[key] = widths
+        return widths
+
+    def _blend_text(self, frame: np.ndarray, text: str, font_size: int, x: int, y: int,
+                    color: tuple, opacity: float = 1.0, reveal_width: Optional[int] = None) -> np.ndarray:
+        """
+        Alpha-blend text drawn at (x, y) into frame in place, touching only the text ROI.
+
+        Frames are BGR end to end (that is what the video writers consume), so color must be
+        a BGR tuple; no RGB<->BGR conversion pass is ever made over the frame.
+        If reveal_width is given, only the part of the text left of x + reveal_width is drawn.
+        """
+        mask, bbox = self._get_text_mask(text, font_size)
+        if mask.size == 0 or opacity <= 0:
             return frame
 
-        elif self.visual_style == 'cinematic':
-            # Dark cinematic look with subtle animation
-            base_color = 20  # Very dark
-            frame = np.full((self.height, self.width, 3), base_color, dtype=np.uint8)
-            # Add subtle vignette effect
-            center_y, center_x = self.height // 2, self.width // 2
-            y_coords, x_coords = np.ogrid[:self.height, :self.width]
-            dist_from_center = np.sqrt((y_coords - center_y)**2 + (x_coords - center_x)**2)
-            max_dist = np.sqrt(center_y**2 + center_x**2)
-            vignette = 1 - (dist_from_center / max_dist) * 0.3
-            frame = (frame * vignette[:, :, np.newaxis]).astype(np.uint8)
+        left, top = x + bbox[0], y + bbox[1]
+        mask_height, mask_width = mask.shape
+        frame_height, frame_width = frame.shape[:2]
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + mask_width, frame_width), min(top + mask_height, frame_height)
+        if reveal_width is not None:
+            x1 = min(x1, x + reveal_width)
+        if x0 >= x1 or y0 >= y1:
+            return frame
+
+        alpha = mask[y0 - top:y1 - top, x0 - left:x1 - left, np.newaxis]
+        if opacity < 1.0:
+            alpha = alpha * opacity
+        roi = frame[y0:y1, x0:x1]
+        roi[:] = roi * (1 - alpha) + np.asarray(color[:3], dtype=np.float32) * alpha
+        return frame
+
+    def create_background(self, frame_number: int) -> np.ndarray:
+        """
+        Create animated background based on visual style.
+
+        Static styles (minimal, cinematic) return one shared read-only frame; animated styles
+        draw into the reused scratch buffer ``self._frame_buf``. Copy the result before
+        modifying or keeping it.
+        """
+        if self._frame_buf.shape[:2] != (self.height, self.width):
+            self._rebuild_caches()
+
+        if self._is_bg_static:
+            # Built once in _rebuild_caches; nothing to redraw per frame
+            return self._static_bg
+
+        frame = self._frame_buf
+
+        if self.visual_style == 'vibrant':
+            # Moving color gradient, evaluated over whole rows/columns at once
+            time_phase = (frame_number / self.total_frames) * 4
+            if HAS_NUMBA:
+                # Fused JIT kernel writing straight into the scratch buffer
+                _vibrant_kernel(frame, time_phase)
+                return frame
+
+            # Each channel varies only with x, y or x + y, so a single np.sin over the stacked
+            # 1-D phases (W + H + H+W-1 values) replaces three full-frame sin passes
+            width, height = self.width, self.height
+            xs = np.arange(width, dtype=np.float32)
+            ys = np.arange(height, dtype=np.float32)
+            diag = np.arange(width + height - 1, dtype=np.float32)
+            if self._sin_buf is None or self._sin_buf.size != width + height + diag.size:
+                self._rebuild_caches()
+            phases = self._sin_buf
+            np.concatenate([time_phase + xs * 0.01, time_phase + ys * 0.01 + 2,
+                            time_phase + diag * 0.005 + 4], out=phases)
+            values = (128 + 127 * np.sin(phases, out=phases)).astype(np.uint8)
+            row, col, diag_values = np.split(values, [width, width + height])
+            frame[:, :, 0] = row
+            frame[:, :, 1] = col[:, np.newaxis]
+            # Row y of channel 2 is diag_values[y:y + W]; a strided view, no copy
+            frame[:, :, 2] = np.lib.stride_tricks.sliding_window_view(diag_values, width)[:height]
             return frame
 
         elif self.visual_style == 'abstract':
-            # Abstract geometric patterns
-            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-            time_factor = frame_number / self.total_frames
+            # Abstract geometric patterns, looked up from the tables built in _rebuild_caches
+            frame.fill(0)
+            if self._abstract_table is None or len(self._abstract_table[0]) != self.total_frames:
+                self._rebuild_caches()
+            cx, cy, radius, colors = (table[frame_number] for table in self._abstract_table)
 
-            # Create moving geometric shapes
+            # Draw the moving geometric shapes
             for i in range(5):
-                center_x = int(self.width * (0.2 + 0.6 * np.sin(time_factor * 2 + i)))
-                center_y = int(self.height * (0.2 + 0.6 * np.cos(time_factor * 1.5 + i)))
-                radius = int(50 + 30 * np.sin(time_factor * 3 + i))
-                color = [int(100 + 155 * np.sin(time_factor + i)),
-                        int(100 + 155 * np.sin(time_factor + i + 2)),
-                        int(100 + 155 * np.sin(time_factor + i + 4))]
-                cv2.circle(frame, (center_x, center_y), radius, color, -1)
+                cv2.circle(frame, (cx[i], cy[i]), radius[i], colors[i], -1)
 
             return frame
 
         else:
-            return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+            frame.fill(0)
+            return frame
 
     def apply_text_animation(self, text: str, frame_number: int, base_frame: np.ndarray) -> np.ndarray:
         """Apply text animation effects based on animation style."""
+        # The one per-frame allocation: the result is queued for the writer thread, so it
+        # cannot share storage with the background scratch buffer
         frame = base_frame.copy()
 
         if not HAS_PILLOW:
             return self._apply_opencv_text_animation(text, frame_number, frame)
 
-        # Use PIL for better text rendering
-        pil_image = Image.fromarray(frame)
-        draw = ImageDraw.Draw(pil_image)
-
-        # Load font
-        try:
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, 100 if self.visual_style == 'cinematic' else 80)
-            else:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
+        # Use PIL for better text rendering; glyphs are rasterized once and blended into the text ROI
+        font_size = 100 if self.visual_style == 'cinematic' else 80
 
         # Get text bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
+        _, bbox = self._get_text_mask(text, font_size)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -169,7 +546,7 @@ class EnhancedVideoRenderer:
             x = (self.width - text_width) // 2
             y = (self.height - text_height) // 2
             color = self._get_text_color(alpha)
-            draw.text((x, y), text, fill=color, font=font)
+            self._blend_text(frame, text, font_size, x, y, color)
 
         elif self.text_animation == 'slide':
             # Slide in from left
@@ -183,7 +560,7 @@ class EnhancedVideoRenderer:
             y = (self.height - text_height) // 2
             alpha = 1.0
             color = self._get_text_color(alpha)
-            draw.text((x, y), text, fill=color, font=font)
+            self._blend_text(frame, text, font_size, x, y, color)
 
         elif self.text_animation == 'bounce':
             # Bouncing text effect
@@ -199,40 +576,42 @@ class EnhancedVideoRenderer:
             x = (self.width - text_width) // 2
             alpha = 1.0
             color = self._get_text_color(alpha)
-            draw.text((x, y), text, fill=color, font=font)
+            self._blend_text(frame, text, font_size, x, y, color)
 
         elif self.text_animation == 'typewriter':
             # Typewriter effect
             type_frames = int(2.0 * self.fps)  # 2 seconds for typing
             if frame_number < type_frames:
                 chars_to_show = int((frame_number / type_frames) * len(text))
-                display_text = text[:chars_to_show]
             else:
-                display_text = text
+                chars_to_show = len(text)
 
             x = (self.width - text_width) // 2
             y = (self.height - text_height) // 2
             alpha = 1.0
             color = self._get_text_color(alpha)
-            draw.text((x, y), display_text, fill=color, font=font)
+            # Reveal the already-rasterized full string up to the prefix's advance width
+            if chars_to_show > 0:
+                reveal_width = self._get_prefix_widths(text, font_size)[chars_to_show]
+                self._blend_text(frame, text, font_size, x, y, color, reveal_width=reveal_width)
 
         else:  # Default fade
             x = (self.width - text_width) // 2
             y = (self.height - text_height) // 2
             alpha = 1.0
             color = self._get_text_color(alpha)
-            draw.text((x, y), text, fill=color, font=font)
+            self._blend_text(frame, text, font_size, x, y, color)
 
-        return np.array(pil_image)
+        return frame
 
     def _get_text_color(self, alpha: float) -> tuple:
-        """Get text color based on visual style."""
+        """Get text color based on visual style, as a BGR tuple for drawing into BGR frames."""
         if self.visual_style == 'minimal':
             return tuple(int(255 * alpha) for _ in range(3))
         elif self.visual_style == 'vibrant':
-            return (int(255 * alpha), int(200 * alpha), int(100 * alpha))  # Orange tint
+            return (int(100 * alpha), int(200 * alpha), int(255 * alpha))  # Orange tint
         elif self.visual_style == 'cinematic':
-            return (int(220 * alpha), int(220 * alpha), int(255 * alpha))  # Slight blue tint
+            return (int(255 * alpha), int(220 * alpha), int(220 * alpha))  # Slight blue tint
         elif self.visual_style == 'abstract':
             return (int(255 * alpha), int(255 * alpha), int(255 * alpha))  # White
         else:
@@ -278,7 +657,8 @@ class EnhancedVideoRenderer:
         return frame
 
 
-    def create_text_video(self, text: str, output_path: str, progress_callback: Optional[Callable] = None) -> str:
+    def create_text_video(self, text: str, output_path: str, progress_callback: Optional[Callable] = None,
+                          quality: Optional[Literal['preview', 'full']] = None) -> str:
         """
         Create an enhanced text-to-video with advanced effects.
 
@@ -286,10 +666,18 @@ class EnhancedVideoRenderer:
             text: The text to animate
             output_path: Where to save the MP4 file
             progress_callback: Optional callback for progress updates (0-100)
+            quality: Optional preset ('preview' = 720p/24fps, 'full' = 1080p/30fps) for this
+                render only; the renderer's own size and fps are restored afterwards
 
         Returns:
             Path to the created video file
         """
+        with self._quality_preset(quality):
+            return self._create_text_video(text, output_path, progress_callback)
+
+    def _create_text_video(self, text: str, output_path: str, progress_callback: Optional[Callable]) -> str:
+        """Render text to output_path at the renderer's current settings."""
+        video_writer = None
         try:
             logger.info(f"Starting enhanced video render for text: '{text}' with style: {self.visual_style}, animation: {self.text_animation}")
 
@@ -299,11 +687,7 @@ class EnhancedVideoRenderer:
                 logger.info("Video render: 10% - Initializing enhanced renderer")
 
             # Initialize video writer
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            video_writer = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
-
-            if not video_writer.isOpened():
-                raise Exception("Failed to initialize video writer")
+            video_writer = self._open_video_writer(output_path)
 
             # Update progress
             if progress_callback:
@@ -311,18 +695,20 @@ class EnhancedVideoRenderer:
                 logger.info("Video render: 20% - Video writer initialized")
 
             # Generate frames with enhanced effects
-            for frame_num in range(self.total_frames):
-                # Create frame with enhanced text animation and background
-                frame = self.create_text_frame(text, frame_num)
-
+            total_frames = self.total_frames
+            log_every = max(1, total_frames // 10)
+            next_log = 0
+            frames = self._generate_frames(partial(self.create_text_frame, text))
+            for frame_num, frame in enumerate(frames):
                 # Write frame
                 video_writer.write(frame)
 
                 # Update progress
-                if progress_callback and frame_num % (self.total_frames // 10) == 0:
-                    progress = 20 + int((frame_num / self.total_frames) * 70)
+                if progress_callback and frame_num == next_log:
+                    next_log += log_every
+                    progress = 20 + int((frame_num / total_frames) * 70)
                     progress_callback(progress)
-                    logger.info(f"Video render: {progress}% - Rendering frame {frame_num}/{self.total_frames}")
+                    logger.debug("Video render: %d%% - frame %d/%d", progress, frame_num, total_frames)
 
             # Update progress
             if progress_callback:
@@ -342,12 +728,13 @@ class EnhancedVideoRenderer:
             return output_path
 
         except Exception as e:
+            self._discard_partial_output(video_writer, output_path)
             logger.error(f"Enhanced video rendering failed: {e}")
             raise Exception(f"Failed to create enhanced video: {str(e)}")
 
 
 def create_enhanced_text_video(text: str, output_path: str, progress_callback: Optional[Callable] = None,
-                              duration: int = 5, resolution: str = '1080p',
+                              duration: int = 5, resolution: str = '720p',
                               style: str = 'minimal', animation: str = 'fade') -> str:
     """
     Convenience function to create an enhanced text video with customizable parameters.
@@ -364,13 +751,13 @@ def create_enhanced_text_video(text: str, output_path: str, progress_callback: O
     Returns:
         Path to created video
     """
-    renderer = EnhancedVideoRenderer()
+    renderer = EnhancedVideoRenderer(workers=settings.RENDER_WORKERS)
     renderer.set_parameters(duration=duration, resolution=resolution, style=style, animation=animation)
     return renderer.create_text_video(text, output_path, progress_callback)
 
 
 def create_scene_based_video(scene_dsl: dict, output_path: str, progress_callback: Optional[Callable] = None,
-                           duration: int = 5, resolution: str = '1080p',
+                           duration: int = 5, resolution: str = '720p',
                            style: str = 'minimal', animation: str = 'fade') -> str:
     """
     Create a video based on AI-generated scene DSL with multiple layers and effects.
@@ -387,7 +774,7 @@ def create_scene_based_video(scene_dsl: dict, output_path: str, progress_callbac
     Returns:
         Path to created video
     """
-    renderer = SceneBasedRenderer()
+    renderer = SceneBasedRenderer(workers=settings.RENDER_WORKERS)
     renderer.set_parameters(duration=duration, resolution=resolution, style=style, animation=animation)
     return renderer.create_scene_video(scene_dsl, output_path, progress_callback)
 
@@ -399,6 +786,7 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
         """
         Create video from scene DSL with multiple scenes, layers, and effects.
         """
+        video_writer = None
         try:
             logger.info(f"Starting scene-based video render with DSL: {scene_dsl.keys()}")
 
@@ -408,11 +796,7 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
                 logger.info("Scene render: 10% - Initializing scene renderer")
 
             # Initialize video writer
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            video_writer = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
-
-            if not video_writer.isOpened():
-                raise Exception("Failed to initialize video writer")
+            video_writer = self._open_video_writer(output_path)
 
             # Update progress
             if progress_callback:
@@ -426,26 +810,21 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
                 scenes = [self._create_fallback_scene(scene_dsl)]
 
             total_frames = self.total_frames
-            frame_num = 0
-
-            while frame_num < total_frames:
-                # Determine which scene this frame belongs to
-                scene_frame = frame_num
-                current_scene = scenes[0]  # For now, use first scene
-
-                # Create frame for current scene
-                frame = self.create_scene_frame(current_scene, scene_frame, current_scene.get('duration', self.duration))
+            current_scene = scenes[0]  # For now, use first scene
+            frame_fn = self._compile_scene(current_scene)
+            log_every = max(1, total_frames // 10)
+            next_log = log_every
 
+            for frame_num, frame in enumerate(self._generate_frames(frame_fn), start=1):
                 # Write frame
                 video_writer.write(frame)
 
-                frame_num += 1
-
                 # Update progress
-                if progress_callback and frame_num % (total_frames // 10) == 0:
+                if progress_callback and frame_num == next_log:
+                    next_log += log_every
                     progress = 20 + int((frame_num / total_frames) * 70)
                     progress_callback(progress)
-                    logger.info(f"Scene render: {progress}% - Rendering frame {frame_num}/{total_frames}")
+                    logger.debug("Scene render: %d%% - frame %d/%d", progress, frame_num, total_frames)
 
             # Update progress
             if progress_callback:
@@ -465,6 +844,7 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
             return output_path
 
         except Exception as e:
+            self._discard_partial_output(video_writer, output_path)
             logger.error(f"Scene-based video rendering failed: {e}")
             raise Exception(f"Failed to create scene-based video: {str(e)}")
 
@@ -486,11 +866,58 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
             }]
         }
 
+    def _compile_scene(self, scene: dict) -> Callable[[int], np.ndarray]:
+        """
+        Specialize create_scene_frame for one scene: return a frame_number -> frame function.
+
+        Layer dict lookups, text rasterization and text sizes are resolved once here instead of
+        on every frame. The result is a partial so it still pickles into render worker processes.
+        """
+        scene_duration = scene.get('duration', self.duration)
+        layers = []
+        for layer in scene.get('layers', []):
+            if layer.get('type', 'text') != 'text':
+                layers.append((layer, None))
+                continue
+            content = layer.get('content', 'Text')
+            style = layer.get('style', {})
+            font_size = style.get('font_size', 48)
+            _, bbox = self._get_text_mask(content, font_size)
+            layers.append((layer, (
+                content, font_size, bbox[2] - bbox[0], bbox[3] - bbox[1],
+                self._hex_to_bgr(style.get('color', '#ffffff')),
+                layer.get('animation', {}).get('type', 'static'),
+                layer.get('transform', {}).get('position', 'center'),
+            )))
+        return partial(self._render_compiled_scene, scene, tuple(layers), scene_duration)
+
+    def _render_compiled_scene(self, scene: dict, layers: tuple, scene_duration: float,
+                               frame_number: int) -> np.ndarray:
+        """Render one frame from the layer table built by _compile_scene."""
+        frame = self._scene_background(scene)
+        frame = self.apply_scene_background_effects(frame, scene, frame_number)
+        for layer, text in layers:
+            if text is None:
+                frame = self.render_layer(frame, layer, frame_number, scene_duration)
+                continue
+            content, font_size, text_width, text_height, color, anim_type, position = text
+            x, y = self._text_position(anim_type, position, frame_number, scene_duration,
+                                       text_width, text_height)
+            alpha = self._layer_alpha(anim_type, frame_number, scene_duration)
+            self._blend_text(frame, content, font_size, x, y, color, opacity=alpha)
+        return frame
+
+    def _scene_background(self, scene: dict) -> np.ndarray:
+        """Return a new frame filled with the scene's solid background color."""
+        # Each frame is queued for the writer, so it gets its own storage; filling it is
+        # write-only, unlike copying a cached full-frame background
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        return self._fill_bg(frame, scene.get('background', '#000000'))
+
     def create_scene_frame(self, scene: dict, frame_number: int, scene_duration: float) -> np.ndarray:
         """Create a frame for a specific scene with all its layers."""
         # Start with background
-        background_color = scene.get('background', '#000000')
-        frame = self._hex_to_bgr(background_color)
+        frame = self._scene_background(scene)
 
         # Apply scene-specific background effects
         frame = self.apply_scene_background_effects(frame, scene, frame_number)
@@ -528,22 +955,10 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
         style = layer.get('style', {})
         animation = layer.get('animation', {})
 
-        # Convert frame to PIL for text rendering
-        pil_image = Image.fromarray(frame)
-        draw = ImageDraw.Draw(pil_image)
-
-        # Load font
-        try:
-            font_size = style.get('font_size', 48)
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
+        font_size = style.get('font_size', 48)
 
         # Get text dimensions
-        bbox = draw.textbbox((0, 0), content, font=font)
+        _, bbox = self._get_text_mask(content, font_size)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -552,30 +967,28 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
 
         # Get color
         color_hex = style.get('color', '#ffffff')
-        color_rgb = self._hex_to_rgb(color_hex)
+        color_bgr = self._hex_to_bgr(color_hex)
 
         # Apply animation effects
         alpha = self.calculate_layer_alpha(layer, frame_number, scene_duration)
-        color_rgba = (*color_rgb, int(255 * alpha))
-
-        # Draw text
-        draw.text((x, y), content, fill=color_rgba, font=font)
 
-        return np.array(pil_image)
+        # Draw text into the text ROI only, using the layer alpha as opacity
+        return self._blend_text(frame, content, font_size, x, y, color_bgr, opacity=alpha)
 
     def calculate_text_position(self, layer: dict, frame_number: int, scene_duration: float,
                               text_width: int, text_height: int) -> tuple:
         """Calculate text position with animation."""
-        transform = layer.get('transform', {})
-        position = transform.get('position', 'center')
+        position = layer.get('transform', {}).get('position', 'center')
+        anim_type = layer.get('animation', {}).get('type', 'static')
+        return self._text_position(anim_type, position, frame_number, scene_duration, text_width, text_height)
 
+    def _text_position(self, anim_type: str, position: str, frame_number: int, scene_duration: float,
+                       text_width: int, text_height: int) -> tuple:
+        """Text position for an already-resolved animation type and anchor."""
         base_x = (self.width - text_width) // 2
         base_y = (self.height - text_height) // 2
 
         # Apply animation
-        animation = layer.get('animation', {})
-        anim_type = animation.get('type', 'static')
-
         if anim_type == 'slide':
             progress = frame_number / (scene_duration * self.fps)
             if position == 'left':
@@ -592,9 +1005,10 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
 
     def calculate_layer_alpha(self, layer: dict, frame_number: int, scene_duration: float) -> float:
         """Calculate layer opacity for fade effects."""
-        animation = layer.get('animation', {})
-        anim_type = animation.get('type', 'static')
+        return self._layer_alpha(layer.get('animation', {}).get('type', 'static'), frame_number, scene_duration)
 
+    def _layer_alpha(self, anim_type: str, frame_number: int, scene_duration: float) -> float:
+        """Layer opacity for an already-resolved animation type."""
         if anim_type == 'fade':
             total_frames = scene_duration * self.fps
             fade_frames = int(0.5 * self.fps)  # 0.5 second fade
@@ -625,10 +1039,15 @@ class SceneBasedRenderer(EnhancedVideoRenderer):
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-    def _hex_to_bgr(self, hex_color: str) -> np.ndarray:
-        """Convert hex color to BGR frame."""
+    def _hex_to_bgr(self, hex_color: str) -> tuple:
+        """Convert hex color to BGR tuple."""
         r, g, b = self._hex_to_rgb(hex_color)
-        return np.full((self.height, self.width, 3), (b, g, r), dtype=np.uint8)
+        return (b, g, r)
+
+    def _fill_bg(self, frame: np.ndarray, hex_color: str) -> np.ndarray:
+        """Fill an existing frame with a solid hex color in place."""
+        cv2.rectangle(frame, (0, 0), (self.width, self.height), self._hex_to_bgr(hex_color), -1)
+        return frame
 
 
 # Backward compatibility
@@ -642,14 +1061,14 @@ def create_text_video(text: str, output_path: str, progress_callback: Optional[C
 # For testing
 if __name__ == "__main__":
     # Test the renderer
-    renderer = SimpleVideoRenderer()
+    renderer = EnhancedVideoRenderer()
     output_path = "test_output.mp4"
 
     def progress_callback(progress: int):
         print(f"Progress: {progress}%")
 
     try:
-        result = renderer.create_text_video("Hello from OmniVid MVP!", output_path, progress_callback)
+        result = renderer.create_text_video("Hello from OmniVid MVP!", output_path, progress_callback, quality='preview')
         print(f"Video created successfully: {result}")
     except Exception as e:
         print(f"Failed to create video: {e}")
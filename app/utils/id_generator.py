@@ -1,4 +1,5 @@
 """ID generation utilities."""
+import os
 import uuid
 from typing import Optional
 
@@ -19,7 +20,7 @@ def generate_short_id(prefix: Optional[str] = None) -> str:
     Returns:
         str: A short ID string
     """
-    short_id = uuid.uuid4().hex[:8]  # First 8 chars of a UUID
+    short_id = os.urandom(4).hex()  # 8 hex chars from the OS CSPRNG, as uuid4 uses
     if prefix:
         return f"{prefix}_{short_id}"
     return short_id
@@ -0,0 +1,36 @@
+"""JSON serialization utilities."""
+import json
+
+# orjson is optional; it serializes straight to UTF-8 bytes and is much faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def dump_json_bytes(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        bytes: Encoded JSON, ready for Path.write_bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def loads_json(text):
+    """Parse JSON from str or bytes.
+
+    Args:
+        text: JSON document
+
+    Returns:
+        The decoded object. Malformed input raises json.JSONDecodeError
+        (orjson's error type subclasses it).
+    """
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -7,6 +7,7 @@ from pathlib import Path
 from logging.handlers import RotatingFileHandler
 import structlog
 from app.core.config import settings
+from app.core.logging_config import route_through_queue
 
 def setup_logging():
     """Configure structured logging"""
@@ -42,6 +43,8 @@ def setup_logging():
     root_logger.setLevel(log_level)
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
+    # Do the console/file I/O on a listener thread instead of the logging caller
+    route_through_queue(root_logger)
 
     # Configure structlog
     structlog.configure(
@@ -4,9 +4,12 @@ Run this separately: python -m app.worker
 """
 import asyncio
 import logging
+import os
 import signal
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Set
 
 from app.core.config import settings
 from app.services.job_store import job_store, JobStatus
@@ -17,16 +20,50 @@ from app.core.logging_config import setup_logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Upper bound on an idle wait; wake-ups normally come from job_store.create_job
+IDLE_WAIT_TIMEOUT = 30
+
+# Per-job output directories live under here; created once when the worker starts
+JOBS_DIR = Path("storage") / "jobs"
+
+def _offer_latest(queue: asyncio.Queue, item):
+    """Put item on a one-slot queue, replacing any value not yet consumed"""
+    if queue.full():
+        if queue.get_nowait() is None:
+            # Never drop the stop sentinel
+            item = None
+    queue.put_nowait(item)
+
+
+async def _write_progress(queue: asyncio.Queue, job_id: str):
+    """Store the latest queued progress for a job until None is received"""
+    while True:
+        progress = await queue.get()
+        if progress is None:
+            break
+        await job_store.update_job_progress(job_id, progress)
+
+
 class RenderWorker:
     """Background worker for processing render jobs"""
 
     def __init__(self):
         self.running = False
-        self.current_job_id: Optional[str] = None
+        # Jobs in flight, bounded by WORKER_CONCURRENCY slots
+        self._job_slots = asyncio.Semaphore(settings.WORKER_CONCURRENCY)
+        self._job_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Renders run here so the event loop stays responsive while a video is encoding.
+        # Frame drawing holds the GIL, so these threads overlap encoding (ffmpeg runs in its
+        # own process) and I/O rather than drawing; RENDER_WORKERS adds drawing processes
+        self.render_pool = ThreadPoolExecutor(max_workers=settings.MAX_CONCURRENT_RENDERS,
+                                              thread_name_prefix="render")
 
     async def start(self):
         """Start the worker"""
         logger.info("Starting render worker...")
+        self._loop = asyncio.get_running_loop()
+        JOBS_DIR.mkdir(parents=True, exist_ok=True)
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -42,23 +79,34 @@ class RenderWorker:
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        # Interrupt an idle wait so shutdown does not sit out IDLE_WAIT_TIMEOUT
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(job_store.notify_job_available)
 
     async def _process_loop(self):
         """Main processing loop"""
         while self.running:
             try:
-                # Check for pending jobs in database
-                job = await self._get_next_job()
+                # Only claim a job once a slot is free, so claimed jobs never wait here
+                await self._job_slots.acquire()
+                job = None
+                try:
+                    if self.running:
+                        job = await self._get_next_job()
+                finally:
+                    if job is None:
+                        self._job_slots.release()
 
                 if not job:
-                    # No jobs available, wait a bit
-                    await asyncio.sleep(2)
+                    if self.running:
+                        # No jobs available, sleep until one is enqueued
+                        await job_store.wait_for_job(timeout=IDLE_WAIT_TIMEOUT)
                     continue
 
-                # Process the job
-                self.current_job_id = job.id
-                await self._process_job(job)
-                self.current_job_id = None
+                # Process the job concurrently; _run_job frees the slot when it is done
+                task = asyncio.create_task(self._run_job(job))
+                self._job_tasks.add(task)
+                task.add_done_callback(self._job_tasks.discard)
 
             except Exception as e:
                 logger.error(f"Error in processing loop: {str(e)}", exc_info=True)
@@ -67,24 +115,19 @@ class RenderWorker:
         logger.info("Processing loop ended")
 
     async def _get_next_job(self):
-        """Get next pending job from job store"""
-        # Find the oldest pending job
-        pending_jobs = [
-            job for job in job_store.jobs.values()
-            if job.status == JobStatus.PENDING
-        ]
-        if not pending_jobs:
-            return None
-
-        # Sort by creation time and get the oldest
-        pending_jobs.sort(key=lambda j: j.created_at)
-        job = pending_jobs[0]
-
-        # Mark as processing
-        await job_store.update_job_status(job.id, JobStatus.PROCESSING)
-        logger.info(f"Marked job {job.id} as processing")
+        """Claim the oldest pending job from job store, marking it as processing"""
+        job = await job_store.claim_next_job()
+        if job:
+            logger.info(f"Marked job {job.id} as processing")
         return job
 
+    async def _run_job(self, job):
+        """Process a claimed job, then release its concurrency slot"""
+        try:
+            await self._process_job(job)
+        finally:
+            self._job_slots.release()
+
     async def _process_job(self, job):
         """
         Process a single render job using simple video renderer
@@ -98,33 +141,48 @@ class RenderWorker:
             # Update progress to 10%
             await job_store.update_job_progress(job.id, 10)
 
-            # Create storage directory
-            import os
-            from pathlib import Path
-            storage_dir = Path("storage")
-            storage_dir.mkdir(exist_ok=True)
-            job_dir = storage_dir / "jobs" / job.id
-            job_dir.mkdir(parents=True, exist_ok=True)
+            # Create the job's storage directory; JOBS_DIR already exists
+            job_dir = JOBS_DIR / job.id
+            job_dir.mkdir(exist_ok=True)
             output_path = job_dir / "output.mp4"
 
-            # Progress callback for renderer
+            # Progress callback for renderer; called from a render_pool thread. Ticks
+            # overwrite each other in a one-slot queue and a single writer stores the
+            # latest, so a burst of ticks costs one job_store update rather than one each
+            loop = asyncio.get_running_loop()
+            progress_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+            last_progress = None
+
             def progress_callback(progress: int):
-                asyncio.create_task(job_store.update_job_progress(job.id, progress))
+                nonlocal last_progress
+                # Repeats (e.g. 20% at writer open and again at frame 0) never cross threads
+                if progress == last_progress:
+                    return
+                last_progress = progress
+                loop.call_soon_threadsafe(_offer_latest, progress_queue, progress)
 
             # Update progress to 20%
             await job_store.update_job_progress(job.id, 20)
 
             # Render video using simple renderer
             logger.info(f"Rendering video for job {job.id}")
-            created_path = create_text_video(job.prompt, str(output_path), progress_callback)
+            progress_writer = asyncio.create_task(_write_progress(progress_queue, job.id))
+            try:
+                created_path = await loop.run_in_executor(
+                    self.render_pool, create_text_video, job.prompt, str(output_path), progress_callback
+                )
+            finally:
+                # Flush pending ticks so none can land after the final status update
+                loop.call_soon(_offer_latest, progress_queue, None)
+                await progress_writer
 
             # Verify file was created
             if not os.path.exists(created_path):
                 raise Exception("Video file was not created")
 
-            # Update job as completed
-            await job_store.update_job_status(job.id, JobStatus.COMPLETED)
-            await job_store.update_job_progress(job.id, 100, created_path)
+            # Update job as completed (status, progress and output in one step)
+            await job_store.complete_job(job.id, created_path)
 
             logger.info(f"Job {job.id} completed successfully, output: {created_path}")
 
@@ -138,15 +196,19 @@ class RenderWorker:
         logger.info("Stopping worker...")
         self.running = False
 
-        # Wait for current job to finish
-        if self.current_job_id:
-            logger.info(f"Waiting for current job {self.current_job_id} to finish...")
-            # Give it 30 seconds to finish
-            for _ in range(30):
-                if not self.current_job_id:
-                    break
-                await asyncio.sleep(1)
-
+        # Wait for in-flight jobs to finish
+        if self._job_tasks:
+            logger.info(f"Waiting for {len(self._job_tasks)} running job(s) to finish...")
+            # Give them 30 seconds to finish, then cancel whatever is still running
+            _, pending = await asyncio.wait(self._job_tasks, timeout=30)
+            if pending:
+                logger.warning(f"Cancelling {len(pending)} job(s) still running after 30s")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Drop queued renders; a render still running finishes before the interpreter exits
+        self.render_pool.shutdown(wait=False, cancel_futures=True)
         logger.info("Worker stopped")
 
 
@@ -0,0 +1,90 @@
+const { bundle } = require("@remotion/bundler");
+const { openBrowser, selectComposition, renderMedia } = require("@remotion/renderer");
+const fs = require("fs");
+const path = require("path");
+const readline = require("readline");
+
+// Long-lived render worker: keeps one browser open across renders and reads
+// newline-delimited JSON jobs from stdin: {"id": ..., "comp": ..., "out": ...}.
+// Each job is answered with one JSON line on stdout: {"id": ..., "ok": bool, "error"?: str}.
+// Progress and diagnostics go to stderr so stdout stays a clean protocol channel.
+
+const srcDir = path.join(process.cwd(), "src");
+const entry = path.join(srcDir, "index.tsx");
+let browserPromise = null;
+let bundleCache = null; // { version, serveUrl }
+
+function getBrowser() {
+  if (!browserPromise) {
+    browserPromise = openBrowser("chrome");
+  }
+  return browserPromise;
+}
+
+// Newest modification time under src/; any edit (a newly registered composition,
+// regenerated scene files) changes it
+function srcVersion(dir = srcDir) {
+  let newest = 0;
+  for (const dirent of fs.readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, dirent.name);
+    const mtime = dirent.isDirectory() ? srcVersion(full) : fs.statSync(full).mtimeMs;
+    newest = Math.max(newest, mtime);
+  }
+  return newest;
+}
+
+// Bundle once and reuse the serve URL until the sources change
+async function getServeUrl() {
+  const version = srcVersion();
+  if (!bundleCache || bundleCache.version !== version) {
+    console.error("📦 Bundling Remotion project...");
+    const serveUrl = await bundle({ entryPoint: entry, enableCaching: true });
+    bundleCache = { version, serveUrl };
+  } else {
+    console.error("♻️ Reusing cached bundle");
+  }
+  return bundleCache.serveUrl;
+}
+
+async function render(job) {
+  const puppeteerInstance = await getBrowser();
+  const serveUrl = await getServeUrl();
+  const composition = await selectComposition({ serveUrl, id: job.comp, puppeteerInstance });
+  await renderMedia({
+    composition,
+    serveUrl,
+    codec: "h264",
+    outputLocation: job.out,
+    puppeteerInstance,
+  });
+}
+
+// Jobs are handled one at a time; the Python side runs one server per concurrent render
+let queue = Promise.resolve();
+
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  if (!line.trim()) {
+    return;
+  }
+  queue = queue.then(async () => {
+    let job;
+    try {
+      job = JSON.parse(line);
+      console.error(`🎬 Rendering ${job.comp} -> ${job.out}`);
+      await render(job);
+      process.stdout.write(JSON.stringify({ id: job.id, ok: true }) + "\n");
+    } catch (err) {
+      const id = job ? job.id : null;
+      process.stdout.write(JSON.stringify({ id, ok: false, error: String(err && err.stack || err) }) + "\n");
+    }
+  });
+});
+
+process.stdin.on("end", async () => {
+  await queue;
+  if (browserPromise) {
+    const browser = await browserPromise;
+    await browser.close(true);
+  }
+  process.exit(0);
+});
@@ -1,11 +1,32 @@
 """Script to clean up old or failed jobs from the database."""
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, select
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
 from app.models.video_job import VideoJob, JobStatus
 
+# Rows removed per DELETE statement; bounds how long each statement holds its locks
+DELETE_BATCH_SIZE = 10_000
+
+def _delete_in_batches(db: Session, condition) -> int:
+    """Delete matching jobs server-side, DELETE_BATCH_SIZE rows per committed statement.
+
+    Rows are never loaded into the session, so each batch is a single round-trip.
+
+    Returns:
+        int: Number of jobs deleted
+    """
+    total = 0
+    while True:
+        batch_ids = select(VideoJob.id).where(condition).limit(DELETE_BATCH_SIZE).scalar_subquery()
+        stmt = delete(VideoJob).where(VideoJob.id.in_(batch_ids))
+        deleted = db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+        db.commit()
+        total += deleted
+        if deleted < DELETE_BATCH_SIZE:
+            return total
+
 def clean_old_jobs(days_old: int = 30) -> int:
     """Remove completed or failed jobs older than the specified number of days.
     
@@ -19,22 +40,11 @@ def clean_old_jobs(days_old: int = 30) -> int:
     try:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
         
-        # Find jobs to delete
-        jobs_to_delete = db.query(VideoJob).filter(
-            and_(
-                VideoJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
-                VideoJob.updated_at < cutoff_date
-            )
-        ).all()
-        
-        count = len(jobs_to_delete)
-        
-        # Delete the jobs
-        for job in jobs_to_delete:
-            db.delete(job)
-        
-        db.commit()
-        return count
+        # Delete the jobs without loading them
+        return _delete_in_batches(db, and_(
+            VideoJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+            VideoJob.updated_at < cutoff_date
+        ))
         
     except Exception as e:
         print(f"Error cleaning up jobs: {e}")
@@ -51,19 +61,8 @@ def clean_failed_jobs() -> int:
     """
     db = SessionLocal()
     try:
-        # Find all failed jobs
-        failed_jobs = db.query(VideoJob).filter(
-            VideoJob.status == JobStatus.FAILED
-        ).all()
-        
-        count = len(failed_jobs)
-        
-        # Delete the jobs
-        for job in failed_jobs:
-            db.delete(job)
-        
-        db.commit()
-        return count
+        # Delete all failed jobs without loading them
+        return _delete_in_batches(db, VideoJob.status == JobStatus.FAILED)
         
     except Exception as e:
         print(f"Error cleaning up failed jobs: {e}")
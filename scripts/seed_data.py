@@ -1,6 +1,7 @@
 """Script to seed the database with initial data."""
 import asyncio
 from datetime import datetime, timezone
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
@@ -46,10 +47,8 @@ def seed_database():
             }
         ]
         
-        # Add jobs to database
-        for job_data in jobs:
-            job = VideoJob(**job_data)
-            db.add(job)
+        # Add jobs to database as one executemany INSERT
+        db.execute(insert(VideoJob), jobs)
         
         db.commit()
         print(f"Successfully seeded {len(jobs)} video jobs.")
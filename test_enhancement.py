@@ -17,8 +17,10 @@ async def test():
     print("Testing prompt enhancement:")
     print("=" * 50)
 
-    for prompt in test_prompts:
-        enhanced = await enhance_prompt_for_video(prompt)
+    # Enhance all prompts concurrently; gather keeps results in prompt order
+    results = await asyncio.gather(*(enhance_prompt_for_video(p) for p in test_prompts))
+
+    for prompt, enhanced in zip(test_prompts, results):
         print(f'Original: "{prompt}"')
         print(f'Enhanced: "{enhanced}"')
         print('---')
@@ -5,10 +5,58 @@ Bypasses the normal job queue to directly generate a video.
 """
 
 import asyncio
-import json
+import logging
 import os
 from pathlib import Path
 
+from app.utils.json_utils import dump_json_bytes
+
+logger = logging.getLogger(__name__)
+
+# Created once; each render only makes its own leaf directory
+GENERATED_ROOT = Path("remotion_engine/src/generated")
+GENERATED_ROOT.mkdir(parents=True, exist_ok=True)
+OUTPUTS_ROOT = Path("remotion_engine/outputs")
+OUTPUTS_ROOT.mkdir(exist_ok=True)
+
+# Mock scene description used instead of an LLM call; serialized once at import
+MOCK_DSL = {
+    "metadata": {
+        "width": 1920,
+        "height": 1080,
+        "fps": 30,
+        "duration": 150,
+        "style": "minimal"
+    },
+    "scenes": [
+        {
+            "id": "scene1",
+            "duration": 150,
+            "background": {"type": "color", "color": "#ffffff"},
+            "layers": [
+                {
+                    "type": "circle",
+                    "id": "blue_circle",
+                    "content": {},
+                    "style": {
+                        "fill": "#3b82f6",
+                        "width": 100,
+                        "height": 100
+                    },
+                    "transform": {"x": 0, "y": 540},
+                    "animation": {
+                        "duration": 150,
+                        "from": {"x": 0},
+                        "to": {"x": 1820}
+                    },
+                    "effects": []
+                }
+            ]
+        }
+    ]
+}
+MOCK_DSL_BYTES = dump_json_bytes(MOCK_DSL)
+
 # Mock some dependencies to avoid Redis/DB requirements
 class MockJob:
     def __init__(self, prompt):
@@ -19,57 +67,23 @@ async def generate_video_direct(prompt: str):
     """Direct video generation bypassing job queue"""
 
     from app.services.scene_to_tsx import scene_to_tsx
-    from app.services.remotion_adapter import render_remotion
+    from app.services.remotion_adapter import remotion_pool
+    from app.services.errors import RenderError
 
     print(f"🎬 Starting direct video generation for: '{prompt}'")
 
     job = MockJob(prompt)
-    job_dir = Path("remotion_engine/src/generated") / job.id
-    job_dir.mkdir(parents=True, exist_ok=True)
+    job_dir = GENERATED_ROOT / job.id
+    job_dir.mkdir(exist_ok=True)
 
     try:
         # Step 1: Use mock scene JSON (skip LLM for now)
         print("🤖 Using mock scene description...")
-        dsl = {
-            "metadata": {
-                "width": 1920,
-                "height": 1080,
-                "fps": 30,
-                "duration": 150,
-                "style": "minimal"
-            },
-            "scenes": [
-                {
-                    "id": "scene1",
-                    "duration": 150,
-                    "background": {"type": "color", "color": "#ffffff"},
-                    "layers": [
-                        {
-                            "type": "circle",
-                            "id": "blue_circle",
-                            "content": {},
-                            "style": {
-                                "fill": "#3b82f6",
-                                "width": 100,
-                                "height": 100
-                            },
-                            "transform": {"x": 0, "y": 540},
-                            "animation": {
-                                "duration": 150,
-                                "from": {"x": 0},
-                                "to": {"x": 1820}
-                            },
-                            "effects": []
-                        }
-                    ]
-                }
-            ]
-        }
-        print(f"✅ Mock scene JSON generated with {len(str(dsl))} characters")
+        print(f"✅ Mock scene JSON generated with {len(MOCK_DSL_BYTES)} bytes")
 
         # Save DSL to job directory
         dsl_path = job_dir / "scene.json"
-        dsl_path.write_text(json.dumps(dsl, indent=2), encoding="utf-8")
+        dsl_path.write_bytes(MOCK_DSL_BYTES)
         print(f"💾 Scene JSON saved to {dsl_path}")
 
         # Step 2: Generate Remotion TSX file
@@ -80,29 +94,36 @@ async def generate_video_direct(prompt: str):
 
         # Step 3: Render video with Remotion
         print("🎥 Rendering video with Remotion...")
-        output_file = Path("remotion_engine/outputs") / f"{job.id}.mp4"
-        output_file.parent.mkdir(exist_ok=True)
-
-        success, output_path, logs = await asyncio.to_thread(
-            render_remotion, "GeneratedScene", str(output_file), job.id
-        )
-
-        if success:
-            print(f"🎉 Video rendered successfully!")
-            print(f"📁 Output file: {output_path}")
-            return output_path
-        else:
-            print(f"❌ Rendering failed: {logs}")
+        output_file = OUTPUTS_ROOT / f"{job.id}.mp4"
+
+        # Warm render server: the browser and bundle stay cached between renders
+        try:
+            await remotion_pool.render("GeneratedScene", str(output_file), job.id)
+        except RenderError as e:
+            print(f"❌ Rendering failed: {e}")
             return None
 
-    except Exception as e:
-        print(f"❌ Error during video generation: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"🎉 Video rendered successfully!")
+        print(f"📁 Output file: {output_file}")
+        return str(output_file)
+
+    except Exception:
+        logger.exception("❌ Error during video generation")
         return None
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test prompt for video generation
     prompt = "A blue circle moves from left to right on a white background for 5 seconds"
 
-    asyncio.run(generate_video_direct(prompt))
+    async def main():
+        from app.services.remotion_adapter import remotion_pool
+
+        try:
+            await generate_video_direct(prompt)
+        finally:
+            # Close once at exit so later renders in this process reuse the warm server
+            await remotion_pool.close()
+
+    asyncio.run(main())
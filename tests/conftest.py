@@ -0,0 +1,59 @@
+"""
+Shared test fixtures
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+from app.core.config import settings
+
+# uvloop is optional (uvicorn[standard] installs it on Linux); async tests run on it when present
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Test API key for testing
+TEST_API_KEY = "test-api-key-" + "x" * 32
+
+
+async def _skip_render(job_id, req):
+    """Stands in for process_video_render: jobs are created but never rendered"""
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient per session, so app startup runs once rather than per module"""
+    # Imported here so modules that never touch the API do not import the app
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    # The session portal's loop outlives each request, so renders started by POST /render
+    # would keep running (LLM call, synchronous encode) and stall later requests
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.api.v1.endpoints.render.process_video_render", _skip_render)
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Async client driving the ASGI app in-process, for tests that overlap requests"""
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        yield test_client
+
+    # Endpoints start background renders on this test's loop; stop them before it closes
+    pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+@pytest.fixture
+def auth_headers():
+    """Get authentication headers"""
+    return {settings.API_KEY_HEADER: TEST_API_KEY}
@@ -2,22 +2,10 @@
 API Integration Tests
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 from app.core.config import settings
 import asyncio
 
-client = TestClient(app)
-
-# Test API key for testing
-TEST_API_KEY = "test-api-key-" + "x" * 32
-
-@pytest.fixture
-def auth_headers():
-    """Get authentication headers"""
-    return {settings.API_KEY_HEADER: TEST_API_KEY}
-
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
@@ -25,14 +13,14 @@ def test_root_endpoint():
     assert data["service"] == "OmniVid-Lite API"
     assert data["version"] == "2.0.0"
 
-def test_health_endpoint():
+def test_health_endpoint(client):
     """Test health check endpoint"""
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] in ["healthy", "degraded"]
 
-def test_render_without_auth():
+def test_render_without_auth(client):
     """Test render endpoint without authentication"""
     if not settings.REQUIRE_API_KEY:
         pytest.skip("API key not required in current config")
@@ -43,7 +31,7 @@ def test_render_without_auth():
     )
     assert response.status_code == 401
 
-def test_render_with_invalid_prompt(auth_headers):
+def test_render_with_invalid_prompt(client, auth_headers):
     """Test render with invalid prompt"""
     response = client.post(
         "/api/v1/render",
@@ -52,7 +40,7 @@ def test_render_with_invalid_prompt(auth_headers):
     )
     assert response.status_code == 400
 
-def test_render_success(auth_headers):
+def test_render_success(client, auth_headers):
     """Test successful render job creation"""
     response = client.post(
         "/api/v1/render",
@@ -70,15 +58,16 @@ def test_render_success(auth_headers):
     assert "download_url" in data
     return data["job_id"]
 
-def test_status_not_found():
+def test_status_not_found(client):
     """Test status endpoint with non-existent job"""
     response = client.get("/api/v1/status/invalid-job-id")
     assert response.status_code == 404
 
-def test_status_success(auth_headers):
+@pytest.mark.asyncio
+async def test_status_success(async_client, auth_headers):
     """Test status endpoint with valid job"""
     # First create a job
-    create_response = client.post(
+    create_response = await async_client.post(
         "/api/v1/render",
         headers=auth_headers,
         json={"prompt": "Test video for status check"}
@@ -86,17 +75,18 @@ def test_status_success(auth_headers):
     job_id = create_response.json()["job_id"]
 
     # Check status
-    response = client.get(f"/api/v1/status/{job_id}")
+    response = await async_client.get(f"/api/v1/status/{job_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["job_id"] == job_id
     assert "status" in data
     assert "progress" in data
 
-def test_cancel_job(auth_headers):
+@pytest.mark.asyncio
+async def test_cancel_job(async_client, auth_headers):
     """Test job cancellation"""
     # Create a job
-    create_response = client.post(
+    create_response = await async_client.post(
         "/api/v1/render",
         headers=auth_headers,
         json={"prompt": "Test video for cancellation"}
@@ -104,7 +94,7 @@ def test_cancel_job(auth_headers):
     job_id = create_response.json()["job_id"]
 
     # Cancel it
-    response = client.patch(
+    response = await async_client.patch(
         f"/api/v1/render/cancel/{job_id}",
         headers=auth_headers
     )
@@ -112,20 +102,22 @@ def test_cancel_job(auth_headers):
     data = response.json()
     assert data["message"] == "Cancellation requested"
 
-def test_list_jobs(auth_headers):
+@pytest.mark.asyncio
+async def test_list_jobs(async_client, auth_headers):
     """Test listing user jobs"""
-    # Create a couple jobs
-    job_ids = []
-    for i in range(2):
-        response = client.post(
+    # Create a couple jobs concurrently
+    responses = await asyncio.gather(*(
+        async_client.post(
             "/api/v1/render",
             headers=auth_headers,
             json={"prompt": f"Test video {i}"}
         )
-        job_ids.append(response.json()["job_id"])
+        for i in range(2)
+    ))
+    job_ids = [response.json()["job_id"] for response in responses]
 
     # List jobs
-    response = client.get("/api/v1/render/jobs", headers=auth_headers)
+    response = await async_client.get("/api/v1/render/jobs", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert "jobs" in data
@@ -139,10 +131,11 @@ def test_list_jobs(auth_headers):
     assert "updated_at" in job
 
 
-def test_download_job_not_ready(auth_headers):
+@pytest.mark.asyncio
+async def test_download_job_not_ready(async_client, auth_headers):
     """Test downloading a job that isn't ready"""
     # Create a job
-    response = client.post(
+    response = await async_client.post(
         "/api/v1/render",
         headers=auth_headers,
         json={"prompt": "Test video for download"}
@@ -150,21 +143,37 @@ def test_download_job_not_ready(auth_headers):
     job_id = response.json()["job_id"]
 
     # Try to download before completion
-    response = client.get(f"/api/v1/render/download/{job_id}", headers=auth_headers)
+    response = await async_client.get(f"/api/v1/render/download/{job_id}", headers=auth_headers)
     assert response.status_code == 425  # Too Early
 
 
-def test_rate_limiting():
+def test_rate_limiting(client, auth_headers, monkeypatch):
     """Test rate limiting"""
     if not settings.RATE_LIMIT_ENABLED:
         pytest.skip("Rate limiting not enabled")
 
-    # Make many requests quickly
-    for i in range(settings.RATE_LIMIT_PER_MINUTE + 5):
-        response = client.get("/api/v1/health")
-        if response.status_code == 429:
-            # Got rate limited as expected
-            return
+    from datetime import datetime
+
+    # Counters are keyed on the current minute; freeze the clock so the requests below
+    # cannot straddle a minute boundary
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return cls(2024, 1, 1, 12, 0, 59)
+
+    monkeypatch.setattr("app.middleware.rate_limit.datetime", FrozenDatetime)
+
+    # A client address of its own, so other tests' requests do not count against it
+    headers = {**auth_headers, "X-Forwarded-For": "203.0.113.7"}
+    for _ in range(settings.RATE_LIMIT_PER_MINUTE):
+        response = client.get("/api/v1/status/rate-limit-test", headers=headers)
+        assert response.status_code != 429
+
+    # The next request from that client is over the limit; others are unaffected
+    response = client.get("/api/v1/status/rate-limit-test", headers=headers)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
 
-    # If we get here, rate limiting didn't work
-    pytest.fail("Rate limiting did not trigger")
\ No newline at end of file
+    other_headers = {**auth_headers, "X-Forwarded-For": "203.0.113.8"}
+    response = client.get("/api/v1/status/rate-limit-test", headers=other_headers)
+    assert response.status_code != 429
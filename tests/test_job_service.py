@@ -0,0 +1,54 @@
+"""
+Tests for job status transitions in the job service
+"""
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlmodel import SQLModel, create_engine
+
+from app.db.models import Job, JobStatus
+from app.services import job_service
+
+
+@pytest.fixture
+def job_db(tmp_path, monkeypatch):
+    """Point the sync and async job sessions at a throwaway SQLite file"""
+    db_path = tmp_path / "jobs.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(bind=engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+
+    monkeypatch.setattr("app.db.session.session_local",
+                        sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    monkeypatch.setattr(job_service, "async_session_maker",
+                        async_sessionmaker(async_engine, expire_on_commit=False))
+    yield
+    engine.dispose()
+
+
+def _add_job(status: JobStatus = JobStatus.PENDING) -> str:
+    with job_service.get_db_session() as session:
+        session.add(Job(id="job-1", prompt="a spinning cube", status=status))
+        session.commit()
+    return "job-1"
+
+
+@pytest.mark.asyncio
+async def test_update_job_status_async_keeps_status(job_db):
+    """Moving a job to PROCESSING leaves it PROCESSING"""
+    job_id = _add_job()
+
+    await job_service.update_job_status_async(job_id, JobStatus.PROCESSING)
+
+    assert job_service.get_job(job_id).status == JobStatus.PROCESSING
+    assert (await job_service.get_job_async(job_id)).status == JobStatus.PROCESSING
+
+
+def test_cancel_job(job_db):
+    """Active jobs can be cancelled; finished ones cannot"""
+    job_id = _add_job(JobStatus.PROCESSING)
+
+    assert job_service.cancel_job(job_id) is True
+    assert job_service.get_job(job_id).status == JobStatus.CANCELLED
+    assert job_service.cancel_job(job_id) is False
+    assert job_service.cancel_job("missing") is False
@@ -0,0 +1,37 @@
+"""
+In-memory job store tests
+"""
+import pytest
+from app.services.job_store import InMemoryJobStore, JobStatus
+
+
+@pytest.mark.asyncio
+async def test_claim_next_job_oldest_first():
+    """Test that pending jobs are claimed in creation order, skipping cancelled ones"""
+    store = InMemoryJobStore()
+    for job_id in ("a", "b", "c"):
+        await store.create_job(job_id, "Test prompt")
+    await store.cancel_job("a")
+
+    assert (await store.claim_next_job()).id == "b"
+    assert (await store.claim_next_job()).id == "c"
+    assert await store.claim_next_job() is None
+
+
+@pytest.mark.asyncio
+async def test_pending_heap_shrinks_without_claims():
+    """Test that jobs finished outside claim_next_job do not pile up in the pending heap"""
+    store = InMemoryJobStore()
+    for i in range(100):
+        job_id = f"job-{i}"
+        await store.create_job(job_id, "Test prompt")
+        await store.update_job_status(job_id, JobStatus.PROCESSING)
+        await store.complete_job(job_id, f"/tmp/{job_id}.mp4")
+
+    # Stale entries are compacted away once they make up half the heap
+    assert len(store._pending) <= 1
+
+    await store.create_job("still-pending", "Test prompt")
+    assert await store.cleanup_old_jobs() == 100
+    assert list(store.jobs) == ["still-pending"]
+    assert [entry[2].id for entry in store._pending] == ["still-pending"]
@@ -7,19 +7,24 @@ from app.services.llm_client import llm_client
 from app.schemas.scene_schema import DSLModel, SceneModel, TextLayer
 from pydantic import ValidationError
 
+# Error messages _categorize_ai_error should classify as retryable / not retryable
+TEMP_AI_ERRORS = ("timeout", "connection refused", "rate limit exceeded", "service unavailable")
+PERMANENT_AI_ERRORS = ("authentication failed", "invalid api key", "model not found", "quota exceeded")
 
-@pytest.mark.asyncio
-async def test_validate_prompt():
+# One character over the 1000-character prompt limit
+LONG_PROMPT = "x" * 1001
+
+
+def test_validate_prompt():
     """Test prompt validation"""
     # Valid prompt
-    assert await llm_service.validate_prompt("Create a beautiful video with text")
+    assert llm_service.validate_prompt("Create a beautiful video with text")
 
     # Too short
-    assert not await llm_service.validate_prompt("Short")
+    assert not llm_service.validate_prompt("Short")
 
     # Too long
-    long_prompt = "x" * 1001
-    assert not await llm_service.validate_prompt(long_prompt)
+    assert not llm_service.validate_prompt(LONG_PROMPT)
 
 
 @pytest.mark.asyncio
@@ -114,40 +119,16 @@ class TestLLMClientValidation:
         assert scene["layers"][0]["type"] == "text"
         assert "Hello from invalid JSON" in scene["layers"][0]["content"]
 
-    def test_categorize_ai_error_temporary(self):
-        """Test categorization of temporary AI errors"""
-        from app.api.v1.endpoints.render import _categorize_ai_error
-
-        temp_errors = [
-            Exception("timeout"),
-            Exception("connection refused"),
-            Exception("rate limit exceeded"),
-            Exception("service unavailable")
-        ]
-
-        for error in temp_errors:
-            assert _categorize_ai_error(error) == "temporary"
-
-    def test_categorize_ai_error_permanent(self):
-        """Test categorization of permanent AI errors"""
-        from app.api.v1.endpoints.render import _categorize_ai_error
-
-        perm_errors = [
-            Exception("authentication failed"),
-            Exception("invalid api key"),
-            Exception("model not found"),
-            Exception("quota exceeded")
-        ]
-
-        for error in perm_errors:
-            assert _categorize_ai_error(error) == "permanent"
-
-    def test_categorize_ai_error_unknown(self):
-        """Test categorization of unknown AI errors"""
+    @pytest.mark.parametrize("message,expected", (
+        [(message, "temporary") for message in TEMP_AI_ERRORS]
+        + [(message, "permanent") for message in PERMANENT_AI_ERRORS]
+        + [("some random error", "unknown")]
+    ))
+    def test_categorize_ai_error(self, message, expected):
+        """Test categorization of temporary, permanent and unknown AI errors"""
         from app.api.v1.endpoints.render import _categorize_ai_error
 
-        unknown_error = Exception("some random error")
-        assert _categorize_ai_error(unknown_error) == "unknown"
+        assert _categorize_ai_error(Exception(message)) == expected
 
 
 class TestSceneSchemaValidation:
@@ -255,4 +236,85 @@ class TestSceneSchemaValidation:
             "layers": [{"type": "text", "id": "text1", "content": "test"}]
         }
         with pytest.raises(ValidationError):
-            SceneModel(**invalid_scene)
\ No newline at end of file
+            SceneModel(**invalid_scene)
+
+class TestLLMCache:
+    """Test exact-match caching of generated DSL"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_served_from_cache(self, monkeypatch):
+        """Test that an identical request does not call the model again"""
+        from app.services.llm_cache import llm_cache
+
+        calls = []
+
+        async def fake_generate(user_prompt, temperature, max_tokens, max_retries):
+            calls.append(user_prompt)
+            return {"meta": {"fps": 30}, "scenes": []}
+
+        llm_cache.clear()
+        monkeypatch.setattr(llm_client, "_generate_uncached", fake_generate)
+
+        prompt = "Create a video with text 'Hello World' that fades in"
+        first = await llm_client.generate_dsl(prompt)
+        first["scenes"].append("mutated by caller")
+        second = await llm_client.generate_dsl(prompt)
+        await llm_client.generate_dsl(prompt, temperature=0.9)
+
+        assert len(calls) == 2
+        assert second == {"meta": {"fps": 30}, "scenes": []}
+        llm_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_fallback_dsl_not_cached(self, monkeypatch):
+        """Test that a fallback built from a malformed reply is not reused"""
+        from app.services.llm_cache import llm_cache
+
+        calls = []
+
+        async def fake_generate(user_prompt, temperature, max_tokens, max_retries):
+            calls.append(user_prompt)
+            return llm_client._extract_json_from_text('{"text": "Hello"}')
+
+        llm_cache.clear()
+        monkeypatch.setattr(llm_client, "_generate_uncached", fake_generate)
+
+        prompt = "Create a video with text 'Hello World' that fades in"
+        await llm_client.generate_dsl(prompt)
+        await llm_client.generate_dsl(prompt)
+
+        assert len(calls) == 2
+        llm_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_always_calls_model(self, monkeypatch):
+        """Test that uncached calls (health checks) neither read nor fill the cache"""
+        from app.services.llm_cache import llm_cache
+
+        calls = []
+
+        async def fake_generate(user_prompt, temperature, max_tokens, max_retries):
+            calls.append(user_prompt)
+            return {"meta": {"fps": 30}, "scenes": []}
+
+        llm_cache.clear()
+        monkeypatch.setattr(llm_client, "_generate_uncached", fake_generate)
+
+        prompt = "Create a video with text 'Hello World' that fades in"
+        await llm_client.generate_dsl(prompt)
+        await llm_client.generate_dsl(prompt, use_cache=False)
+        await llm_client.generate_dsl("Another prompt for the probe", use_cache=False)
+        await llm_client.generate_dsl("Another prompt for the probe")
+
+        # Every call reached the model: the probes skipped the cache and left nothing in it
+        assert len(calls) == 4
+        llm_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped(self):
+        """Test that entries past their TTL are not returned"""
+        from app.services.llm_cache import LLMCache
+
+        cache = LLMCache(ttl_seconds=0, max_entries=4)
+        await cache.set("key", {"scenes": []})
+        assert await cache.get("key") is None
@@ -0,0 +1,46 @@
+"""
+Pipeline tests
+"""
+import pytest
+from app.services import pipeline
+
+VALID_DSL = {
+    "metadata": {"width": 1280, "height": 720, "fps": 30, "duration": 5},
+    "scenes": [{
+        "id": "main_scene",
+        "duration": 5,
+        "background": {"color": "#000000"},
+        "layers": [{"type": "text", "id": "title", "content": "Hello"}],
+    }],
+}
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_renders_generated_scene(tmp_path, monkeypatch):
+    """Test that the render step gets the job directory the TSX was written to"""
+    rendered = []
+
+    async def fake_generate_dsl(prompt):
+        return VALID_DSL
+
+    def fake_scene_to_tsx(dsl_path, tsx_path, component_name):
+        rendered.append(("tsx", tsx_path))
+
+    def fake_render_remotion(composition_id, output_path, job_dir):
+        rendered.append(("render", composition_id, output_path, job_dir))
+
+    monkeypatch.setattr(pipeline, "GENERATED_SRC", tmp_path / "generated")
+    monkeypatch.setattr(pipeline, "OUTPUT_DIR", tmp_path / "outputs")
+    (tmp_path / "generated").mkdir()
+    monkeypatch.setattr(pipeline.llm_client, "generate_dsl", fake_generate_dsl)
+    monkeypatch.setattr(pipeline, "scene_to_tsx", fake_scene_to_tsx)
+    monkeypatch.setattr(pipeline, "render_remotion", fake_render_remotion)
+
+    result = await pipeline.run_pipeline("A title that fades in", "job123")
+
+    assert result["status"] == "done", result
+    output_file = str(tmp_path / "outputs" / "job123.mp4")
+    assert rendered == [
+        ("tsx", str(tmp_path / "generated" / "job123" / "GeneratedScene.tsx")),
+        ("render", "GeneratedScene_job123", output_file, "job123"),
+    ]
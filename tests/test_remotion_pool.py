@@ -0,0 +1,107 @@
+"""
+Remotion render pool tests, against a stand-in for scripts/render_server.js
+"""
+import asyncio
+import sys
+import pytest
+from app.services import remotion_adapter
+from app.services.errors import RenderError
+from app.services.remotion_adapter import RemotionPool
+
+# Speaks the render server's protocol; "slow" compositions take a while, "stale"
+# ones are answered with the wrong request id, "noisy" ones log to stdout first
+FAKE_SERVER = r"""
+import json, sys, time
+for line in sys.stdin:
+    job = json.loads(line)
+    if job["comp"] == "slow":
+        time.sleep(0.5)
+    if job["comp"] == "noisy":
+        print("Rendering frame 1/150", flush=True)
+    reply_id = -1 if job["comp"] == "stale" else job["id"]
+    print(json.dumps({"id": reply_id, "ok": True}), flush=True)
+"""
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = RemotionPool(1)
+    started = []
+
+    async def start_fake_server():
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", FAKE_SERVER,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        pool._procs.add(proc)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(remotion_adapter, "_register_composition", lambda composition_id, job_dir: None)
+    monkeypatch.setattr(pool, "_start_server", start_fake_server)
+    pool.started = started
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_server_reused_between_renders(pool):
+    """Test that consecutive renders share one warm server"""
+    await pool.render("scene", "out1.mp4", "job1")
+    await pool.render("scene", "out2.mp4", "job2")
+
+    assert len(pool.started) == 1
+    await pool.close()
+    assert pool.started[0].returncode == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_render_does_not_leak_reply(pool):
+    """Test that a render cancelled mid-flight never hands its reply to the next caller"""
+    task = asyncio.create_task(pool.render("slow", "out1.mp4", "job1"))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await pool.render("scene", "out2.mp4", "job2")
+
+    assert len(pool.started) == 2
+    assert pool.started[0].returncode is not None
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_mismatched_reply_id_fails(pool):
+    """Test that a reply for another request is rejected and the server replaced"""
+    with pytest.raises(RenderError, match="expected"):
+        await pool.render("stale", "out1.mp4", "job1")
+
+    await pool.render("scene", "out2.mp4", "job2")
+    assert len(pool.started) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_non_json_reply_fails(pool):
+    """Test that stray stdout output is rejected and the server replaced"""
+    with pytest.raises(RenderError, match="invalid reply"):
+        await pool.render("noisy", "out1.mp4", "job1")
+
+    await pool.render("scene", "out2.mp4", "job2")
+    assert len(pool.started) == 2
+    assert pool.started[0].returncode is not None
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_close_kills_busy_server(pool):
+    """Test that close() also stops servers in the middle of a render"""
+    task = asyncio.create_task(pool.render("slow", "out1.mp4", "job1"))
+    await asyncio.sleep(0.2)
+
+    await pool.close()
+
+    with pytest.raises(RenderError, match="exited"):
+        await task
+    assert pool.started[0].returncode is not None
@@ -1,14 +1,9 @@
 """Tests for the video API endpoints."""
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
 from app.core.config import settings
 
-# Set up test client
-client = TestClient(app)
-
-def test_generate_video():
+def test_generate_video(client):
     """Test video generation endpoint."""
     test_data = {
         "prompt": "A serene beach at sunset",
@@ -25,7 +20,7 @@ def test_generate_video():
     assert "job_id" in data
     assert data["status"] == "queued"
 
-def test_get_video_status():
+def test_get_video_status(client):
     """Test video status endpoint."""
     # First create a job
     test_data = {
@@ -50,7 +45,7 @@ def test_get_video_status():
     assert data["job_id"] == job_id
     assert "status" in data
 
-def test_invalid_prompt():
+def test_invalid_prompt(client):
     """Test video generation with invalid prompt."""
     test_data = {
         "prompt": "",  # Empty prompt
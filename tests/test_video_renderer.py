@@ -0,0 +1,86 @@
+"""
+Video renderer tests
+"""
+import shutil
+from functools import partial
+
+import numpy as np
+import pytest
+from app.services import video_renderer
+from app.services.video_renderer import EnhancedVideoRenderer, FFmpegVideoWriter
+
+
+def _render_frames(workers: int) -> list:
+    renderer = EnhancedVideoRenderer(width=320, height=180, fps=10, duration=2, workers=workers)
+    renderer.set_parameters(style='abstract', animation='slide')
+    # In-process frames reuse scratch buffers, so keep copies
+    return [frame.copy() for frame in renderer._generate_frames(partial(renderer.create_text_frame, "Hello"))]
+
+
+def test_frame_pool_matches_serial_render():
+    """Test that rendering across worker processes yields the serial frames, in order"""
+    serial = _render_frames(workers=1)
+    pooled = _render_frames(workers=2)
+
+    assert len(pooled) == len(serial) == 20
+    for serial_frame, pooled_frame in zip(serial, pooled):
+        np.testing.assert_array_equal(pooled_frame, serial_frame)
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not installed")
+def test_ffmpeg_writer_reports_encoder_failure(tmp_path):
+    """Test that release() reaps a dead ffmpeg and raises its error, not BrokenPipeError"""
+    writer = FFmpegVideoWriter(str(tmp_path / "out.mp4"), 10, (8, 8))
+    # ffmpeg dies mid-encode
+    writer._proc.kill()
+    writer._proc.wait(timeout=10)
+    # Small enough to sit in the pipe's write buffer until release() flushes it
+    writer.write(np.zeros((8, 8, 3), dtype=np.uint8))
+
+    with pytest.raises(RuntimeError, match="ffmpeg exited"):
+        writer.release()
+    assert writer._proc.returncode is not None
+
+
+@pytest.mark.skipif(not video_renderer.HAS_NUMBA, reason="numba not installed")
+def test_vibrant_kernel_matches_numpy_path(monkeypatch):
+    """Test that the Numba and NumPy vibrant backgrounds draw the same pixels"""
+    # At 720p the old float64 kernel disagreed with NumPy on a few frames of these 30
+    renderer = EnhancedVideoRenderer(width=1280, height=720, fps=10, duration=3)
+    renderer.set_parameters(style='vibrant')
+    frame_numbers = range(renderer.total_frames)
+    jitted = [renderer.create_background(n).copy() for n in frame_numbers]
+
+    monkeypatch.setattr(video_renderer, "HAS_NUMBA", False)
+    for frame_number, expected in zip(frame_numbers, jitted):
+        np.testing.assert_array_equal(renderer.create_background(frame_number), expected)
+
+
+def test_quality_preset_applies_to_one_render(tmp_path, monkeypatch):
+    """Test that create_text_video(quality=...) leaves the renderer's size and fps as they were"""
+    renderer = EnhancedVideoRenderer(width=320, height=180, fps=10, duration=1)
+    seen = []
+
+    def fake_render(text, output_path, progress_callback):
+        seen.append((renderer.width, renderer.height, renderer.fps, renderer.total_frames))
+        return output_path
+
+    monkeypatch.setattr(renderer, "_create_text_video", fake_render)
+    renderer.create_text_video("Hello", str(tmp_path / "out.mp4"), quality='preview')
+
+    assert seen == [(1280, 720, 24, 24)]
+    assert (renderer.width, renderer.height, renderer.fps, renderer.total_frames) == (320, 180, 10, 10)
+    assert renderer.create_background(0).shape == (180, 320, 3)
+
+
+@pytest.mark.skipif(not video_renderer.HAS_PILLOW, reason="Pillow not installed")
+def test_text_mask_covers_every_line():
+    """Test that multiline text is rasterized in full rather than clipped to its first line"""
+    renderer = EnhancedVideoRenderer(width=320, height=180, fps=10, duration=1)
+    single, _ = renderer._get_text_mask("Line one", 32)
+    multi, bbox = renderer._get_text_mask("Line one\nLine two", 32)
+
+    assert multi.shape == (bbox[3] - bbox[1], bbox[2] - bbox[0])
+    assert multi.shape[0] > 1.5 * single.shape[0]
+    # The second line's glyphs are in the mask
+    assert multi[multi.shape[0] // 2:].max() > 0.5
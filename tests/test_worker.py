@@ -0,0 +1,36 @@
+"""
+Render worker tests
+"""
+import pytest
+from app import worker as worker_module
+from app.services.job_store import job_store, JobStatus
+
+
+@pytest.mark.asyncio
+async def test_process_job_without_start(tmp_path, monkeypatch):
+    """Test that a job driven directly (no start()) reports progress and completes"""
+    ticks = []
+
+    def fake_create_text_video(text, output_path, progress_callback):
+        for progress in (30, 60, 90):
+            progress_callback(progress)
+            ticks.append(progress)
+        with open(output_path, "wb") as f:
+            f.write(b"mp4")
+        return output_path
+
+    monkeypatch.setattr(worker_module, "JOBS_DIR", tmp_path)
+    monkeypatch.setattr(worker_module, "create_text_video", fake_create_text_video)
+
+    render_worker = worker_module.RenderWorker()
+    job = await job_store.create_job("worker-direct-test", "A title that fades in")
+    try:
+        await render_worker._process_job(job)
+    finally:
+        render_worker.render_pool.shutdown()
+
+    job = job_store.jobs.pop("worker-direct-test")
+    assert ticks == [30, 60, 90]
+    assert job.status == JobStatus.COMPLETED, job.error
+    assert job.progress == 100
+    assert job.output_path == str(tmp_path / "worker-direct-test" / "output.mp4")